@@ -1,28 +1,57 @@
 """CLI wrapper for OrcaSlicer profile validation."""
 
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
-from src.validator import ProfileValidator
+
+# Only emit ANSI colors when the stream is a terminal
+_STDOUT_COLOR = sys.stdout.isatty()
+_STDERR_COLOR = sys.stderr.isatty()
+
+_RED = "\033[91m" if _STDOUT_COLOR else ""
+_YELLOW = "\033[93m" if _STDOUT_COLOR else ""
+_BLUE = "\033[94m" if _STDOUT_COLOR else ""
+_GREEN = "\033[92m" if _STDOUT_COLOR else ""
+_RESET = "\033[0m" if _STDOUT_COLOR else ""
 
 
 # Utility functions for printing messages in different colors.
 def print_error(msg):
-    print(f"\033[91m[ERROR]\033[0m {msg}")  # Red
+    print(f"{_RED}[ERROR]{_RESET} {msg}")  # Red
 
 def print_warning(msg):
-    print(f"\033[93m[WARNING]\033[0m {msg}")  # Yellow
+    print(f"{_YELLOW}[WARNING]{_RESET} {msg}")  # Yellow
 
 def print_info(msg):
-    print(f"\033[94m[INFO]\033[0m {msg}")  # Blue
+    print(f"{_BLUE}[INFO]{_RESET} {msg}")  # Blue
 
 def print_success(msg):
-    print(f"\033[92m[SUCCESS]\033[0m {msg}")  # Green
+    print(f"{_GREEN}[SUCCESS]{_RESET} {msg}")  # Green
 
 
+# Pre-styled issue prefixes, built once instead of per issue via click.style.
+# Errors go to stderr and warnings to stdout, so each follows its own stream.
+if _STDERR_COLOR:
+    _ERROR_PREFIX = click.style("[ERROR] ", fg="red", reset=False)
+    _ERROR_RESET = "\033[0m"
+else:
+    _ERROR_PREFIX = "[ERROR] "
+    _ERROR_RESET = ""
 
+if _STDOUT_COLOR:
+    _WARNING_PREFIX = click.style("[WARNING] ", fg="yellow", reset=False)
+    _WARNING_RESET = "\033[0m"
+else:
+    _WARNING_PREFIX = "[WARNING] "
+    _WARNING_RESET = ""
+
+# Shared libraries under the profiles directory that are not vendors
+_EXCLUDED_VENDORS = frozenset({"OrcaFilamentLibrary"})
 
 
 @click.group()
@@ -64,6 +93,9 @@ def check(
     profiles_dir: Path | None,
 ) -> None:
     """Check profiles for common issues."""
+    from src.validator import ProfileValidator
+    from src.validator import ValidationResult
+
     if profiles_dir is None:
         script_dir = Path(__file__).resolve().parent
         profiles_dir = script_dir.parent / "resources" / "profiles"
@@ -72,7 +104,25 @@ def check(
 
     validator = ProfileValidator(profiles_dir)
     checked_vendor_count = 0
-    all_issues = []
+    level_counts: Counter[str] = Counter()
+
+    def report(result: ValidationResult) -> None:
+        # Print issues as each vendor finishes, keeping only the counts.
+        # Lines are joined so each stream gets one write per vendor.
+        error_lines: list[str] = []
+        warning_lines: list[str] = []
+        for issue in result.issues:
+            level_counts[issue.level] += 1
+            if issue.level == "error":
+                error_lines.append(f"{_ERROR_PREFIX}{issue.message}{_ERROR_RESET}")
+            else:
+                warning_lines.append(
+                    f"{_WARNING_PREFIX}{issue.message}{_WARNING_RESET}"
+                )
+        if error_lines:
+            click.echo("\n".join(error_lines), err=True)
+        if warning_lines:
+            click.echo("\n".join(warning_lines))
 
     if vendor:
         result = validator.validate_all(
@@ -81,51 +131,54 @@ def check(
             check_materials=check_materials,
             check_obsolete=check_obsolete_keys,
         )
-        all_issues.extend(result.issues)
+        report(result)
         checked_vendor_count = 1
     else:
-        for vendor_dir in profiles_dir.iterdir():
-            if not vendor_dir.is_dir() or vendor_dir.name == "OrcaFilamentLibrary":
-                continue
-            result = validator.validate_all(
-                vendor_dir.name,
+        with os.scandir(profiles_dir) as entries:
+            vendor_names = [
+                entry.name
+                for entry in entries
+                if entry.name not in _EXCLUDED_VENDORS and entry.is_dir()
+            ]
+
+        def validate_vendor(name: str) -> ValidationResult:
+            return validator.validate_all(
+                name,
                 check_filaments=check_filaments,
                 check_materials=check_materials,
                 check_obsolete=check_obsolete_keys,
             )
-            all_issues.extend(result.issues)
-            checked_vendor_count += 1
 
-    # Print issues
-    for issue in all_issues:
-        if issue.level == "error":
-            click.echo(click.style(f"[ERROR] {issue.message}", fg="red"), err=True)
-        else:
-            click.echo(click.style(f"[WARNING] {issue.message}", fg="yellow"))
+        # Validation is I/O bound; map() keeps results in vendor order
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for result in executor.map(validate_vendor, vendor_names):
+                report(result)
+                checked_vendor_count += 1
 
     # Print summary
-    errors = [i for i in all_issues if i.level == "error"]
-    warnings = [i for i in all_issues if i.level == "warning"]
+    error_count = level_counts["error"]
+    warning_count = level_counts["warning"]
 
     click.echo("\n" + "=" * 50)
     click.echo(click.style(f"Checked vendors     : {checked_vendor_count}", fg="blue"))
 
-    if errors:
+    if error_count:
         click.echo(
-            click.style(f"Files with errors   : {len(errors)}", fg="red"),
+            click.style(f"Files with errors   : {error_count}", fg="red"),
             err=True,
         )
     else:
         click.echo(click.style("Files with errors   : 0", fg="green"))
 
-    if warnings:
-        click.echo(click.style(f"Files with warnings : {len(warnings)}", fg="yellow"))
+    if warning_count:
+        click.echo(click.style(f"Files with warnings : {warning_count}", fg="yellow"))
     else:
         click.echo(click.style("Files with warnings : 0", fg="green"))
 
     click.echo("=" * 50)
 
-    sys.exit(1 if errors else 0)
+    sys.exit(1 if error_count else 0)
 
 
 if __name__ == "__main__":
@@ -6,18 +6,16 @@ import click
 
 from src import __version__
 from src.config import create_config
-from src.constants import TEMPLATE_VERSION
-from src.exporter import ExportError
-from src.exporter import ProfileExporter
-from src.resolver import CircularInheritanceError
-from src.resolver import InvalidProfileError
-from src.resolver import ProfileNotFoundError
-from src.resolver import ProfileResolver
+
+# The exporter, resolver and template constants are imported inside the
+# commands so --help and --version don't pay for loading them.
 
 
 def _show_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
     """Display tool version and template version."""
     if value:
+        from src.constants import TEMPLATE_VERSION
+
         click.echo(f"orcaslicer-export, version {__version__}")
         click.echo(f"Templates: {TEMPLATE_VERSION}")
         ctx.exit()
@@ -94,6 +92,13 @@ def export(
         orcaslicer-export "/path/to/profile.json" -o exports --output-name
         custom.json --validate
     """
+    from src.exporter import ExportError
+    from src.exporter import ProfileExporter
+    from src.resolver import CircularInheritanceError
+    from src.resolver import InvalidProfileError
+    from src.resolver import ProfileNotFoundError
+    from src.resolver import ProfileResolver
+
     try:
         profile_path = Path(profile).resolve()
 
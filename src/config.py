@@ -1,9 +1,14 @@
 """OrcaSlicer configuration module for path detection and profile loading."""
 
+import functools
+import os
+import stat
 import sys
 from dataclasses import dataclass
 from enum import Enum
+from itertools import pairwise
 from pathlib import Path
+from typing import Callable
 from typing import Optional
 
 
@@ -23,7 +28,31 @@ class ProfileType(Enum):
     PROCESS = "process"
 
 
-@dataclass(frozen=True)
+# sys.platform value -> Platform
+_PLATFORM_MAP: dict[str, Platform] = {
+    "darwin": Platform.MACOS,
+    "win32": Platform.WINDOWS,
+    "linux": Platform.LINUX,
+}
+
+
+@functools.cache
+def _home_dir() -> Path:
+    """Return the user's home directory, resolved once per process."""
+    return Path.home()
+
+
+# Platform -> builder for the default OrcaSlicer directory
+_DEFAULT_DIR_FN: dict[Platform, Callable[[], Path]] = {
+    Platform.MACOS: lambda: (
+        _home_dir() / "Library" / "Application Support" / "OrcaSlicer"
+    ),
+    Platform.WINDOWS: lambda: _home_dir() / "AppData" / "Roaming" / "OrcaSlicer",
+    Platform.LINUX: lambda: _home_dir() / ".config" / "OrcaSlicer",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ProfileLocation:
     """
     Represents a single location where profiles can be found.
@@ -44,7 +73,7 @@ class ProfileLocation:
             raise ValueError(f"ProfileLocation path must be absolute: {self.path}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchPath:
     """
     Collection of profile locations to search, ordered by priority.
@@ -59,12 +88,11 @@ class SearchPath:
 
     def __post_init__(self) -> None:
         """Validate that locations are sorted by priority."""
-        priorities = [loc.priority for loc in self.locations]
-        if priorities != sorted(priorities):
+        if any(a.priority > b.priority for a, b in pairwise(self.locations)):
             raise ValueError("SearchPath locations must be sorted by priority")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrcaSlicerConfig:
     """
     Configuration for OrcaSlicer directory structure and profile search paths.
@@ -87,10 +115,14 @@ class OrcaSlicerConfig:
             raise ValueError(f"samples_dir must be absolute: {self.samples_dir}")
 
 
+@functools.cache
 def detect_platform() -> Platform:
     """
     Detect the current operating system platform.
 
+    The result is cached for the life of the process; tests that fake
+    sys.platform can reset it with detect_platform.cache_clear().
+
     Returns:
         Platform enum value
 
@@ -101,13 +133,7 @@ def detect_platform() -> Platform:
         >>> detect_platform()  # On macOS
         <Platform.MACOS: 'darwin'>
     """
-    platform_map = {
-        "darwin": Platform.MACOS,
-        "win32": Platform.WINDOWS,
-        "linux": Platform.LINUX,
-    }
-
-    platform = platform_map.get(sys.platform)
+    platform = _PLATFORM_MAP.get(sys.platform)
     if platform is None:
         raise RuntimeError(f"Unsupported platform: {sys.platform}")
 
@@ -128,15 +154,80 @@ def get_default_orcaslicer_dir(platform: Platform) -> Path:
         >>> get_default_orcaslicer_dir(Platform.MACOS)
         PosixPath('/Users/username/Library/Application Support/OrcaSlicer')
     """
-    if platform == Platform.MACOS:
-        return Path.home() / "Library" / "Application Support" / "OrcaSlicer"
-    if platform == Platform.WINDOWS:
-        appdata = Path.home() / "AppData" / "Roaming"
-        return appdata / "OrcaSlicer"
-    if platform == Platform.LINUX:
-        return Path.home() / ".config" / "OrcaSlicer"
+    default_dir_fn = _DEFAULT_DIR_FN.get(platform)
+    if default_dir_fn is None:
+        raise ValueError(f"Unknown platform: {platform}")
+
+    return default_dir_fn()
+
+
+def _scan_vendor_dirs(
+    base: Path,
+    profile_type: ProfileType,
+    skip_suffix: Optional[str] = None,
+) -> list[tuple[str, Path]]:
+    """
+    Find vendor directories under base that contain a profile_type subdirectory.
 
-    raise ValueError(f"Unknown platform: {platform}")
+    Uses a single os.scandir pass so the directory check for each vendor is
+    served from the cached DirEntry, leaving one stat per profile_type child.
+
+    Args:
+        base: Directory containing one subdirectory per vendor
+        profile_type: Type of profile subdirectory to look for
+        skip_suffix: Ignore entries whose name ends with this suffix, checked
+            before any stat
+
+    Returns:
+        List of (vendor name, profile directory) pairs in scandir order
+    """
+    found: list[tuple[str, Path]] = []
+
+    try:
+        entries = os.scandir(base)
+    except (FileNotFoundError, NotADirectoryError):
+        return found
+
+    with entries:
+        for entry in entries:
+            if skip_suffix is not None and entry.name.endswith(skip_suffix):
+                continue
+            if not entry.is_dir():
+                continue
+            profile_dir = Path(entry.path) / profile_type.value
+            try:
+                mode = profile_dir.stat().st_mode
+            except OSError:
+                continue
+            if not stat.S_ISDIR(mode):
+                continue
+            found.append((entry.name, profile_dir))
+
+    return found
+
+
+def _list_json_files(directory: Path) -> list[Path]:
+    """
+    List the .json files directly inside a directory.
+
+    Args:
+        directory: Directory to scan (missing directories and plain files
+            yield no files)
+
+    Returns:
+        Sorted list of JSON file paths
+    """
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    with entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
 
 
 def build_search_path(
@@ -151,6 +242,9 @@ def build_search_path(
     2. system/ directory (priority 20)
     3. samples/ directory if configured (priority 30)
 
+    Results are cached per (config, profile_type); call clear_search_cache()
+    after creating or removing profile directories.
+
     Args:
         config: OrcaSlicer configuration
         profile_type: Type of profile to search for
@@ -164,54 +258,76 @@ def build_search_path(
         >>> len(search_path.locations)
         0
     """
+    return _cached_search_path(
+        config.base_dir, config.user_profile, config.samples_dir, profile_type
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_search_path(
+    base_dir: Path,
+    user_profile: str,
+    samples_dir: Optional[Path],
+    profile_type: ProfileType,
+) -> SearchPath:
+    """
+    Build and cache the search path for build_search_path.
+
+    Args:
+        base_dir: Base OrcaSlicer configuration directory
+        user_profile: User profile name
+        samples_dir: Optional samples directory for fallback
+        profile_type: Type of profile to search for
+
+    Returns:
+        SearchPath with ordered locations
+    """
     locations: list[ProfileLocation] = []
 
     # Priority 1: User profiles
-    user_dir = config.base_dir / "user" / config.user_profile / profile_type.value
+    user_dir = base_dir / "user" / user_profile / profile_type.value
     if user_dir.exists():
         locations.append(
             ProfileLocation(
                 path=user_dir,
                 priority=10,
-                source=f"user/{config.user_profile}",
+                source=f"user/{user_profile}",
             )
         )
 
     # Priority 2: System profiles (vendor-installed)
-    system_base = config.base_dir / "system"
-    if system_base.exists():
-        for vendor_dir in system_base.iterdir():
-            if vendor_dir.is_dir():
-                profile_dir = vendor_dir / profile_type.value
-                if profile_dir.exists():
-                    locations.append(
-                        ProfileLocation(
-                            path=profile_dir,
-                            priority=20,
-                            source=f"system/{vendor_dir.name}",
-                        )
-                    )
+    system_base = base_dir / "system"
+    for vendor_name, profile_dir in _scan_vendor_dirs(system_base, profile_type):
+        locations.append(
+            ProfileLocation(
+                path=profile_dir,
+                priority=20,
+                source=f"system/{vendor_name}",
+            )
+        )
 
     # Priority 3: Samples fallback
-    if config.samples_dir is not None:
-        samples_profiles = config.samples_dir / "profiles"
-        if samples_profiles.exists():
-            for vendor_dir in samples_profiles.iterdir():
-                if vendor_dir.is_dir() and not vendor_dir.name.endswith(".json"):
-                    profile_dir = vendor_dir / profile_type.value
-                    if profile_dir.exists():
-                        locations.append(
-                            ProfileLocation(
-                                path=profile_dir,
-                                priority=30,
-                                source=f"samples/{vendor_dir.name}",
-                            )
-                        )
-
-    # Sort by priority (should already be sorted due to insertion order)
-    sorted_locations = tuple(sorted(locations, key=lambda loc: loc.priority))
-
-    return SearchPath(locations=sorted_locations, profile_type=profile_type)
+    if samples_dir is not None:
+        samples_profiles = samples_dir / "profiles"
+        for vendor_name, profile_dir in _scan_vendor_dirs(
+            samples_profiles, profile_type, skip_suffix=".json"
+        ):
+            locations.append(
+                ProfileLocation(
+                    path=profile_dir,
+                    priority=30,
+                    source=f"samples/{vendor_name}",
+                )
+            )
+
+    # Insertion order is already by priority; SearchPath validates this
+    return SearchPath(locations=tuple(locations), profile_type=profile_type)
+
+
+def clear_search_cache() -> None:
+    """Discard cached search paths and resolved profile paths."""
+    _cached_search_path.cache_clear()
+    resolve_profile_path.cache_clear()
 
 
 def find_profile_path(
@@ -234,12 +350,17 @@ def find_profile_path(
     """
     for location in search_path.locations:
         candidate = location.path / filename
-        if candidate.exists() and candidate.is_file():
+        try:
+            mode = os.stat(candidate).st_mode
+        except OSError:
+            continue
+        if stat.S_ISREG(mode):
             return candidate
 
     return None
 
 
+@functools.lru_cache(maxsize=512)
 def resolve_profile_path(
     input_path: str,
     config: OrcaSlicerConfig,
@@ -252,6 +373,9 @@ def resolve_profile_path(
     1. Filename only: "Generic PLA.json" -> searches in priority order
     2. Absolute path: "/full/path/to/profile.json" -> validates and returns
 
+    Successful lookups are cached per (input_path, config, profile_type);
+    call clear_search_cache() after moving or deleting profiles.
+
     Args:
         input_path: Either a filename or absolute path
         config: OrcaSlicer configuration
@@ -384,9 +508,9 @@ def list_profiles(
     results: dict[str, list[Path]] = {}
 
     for location in search_path.locations:
-        profile_files = [f for f in location.path.glob("*.json") if f.is_file()]
+        profile_files = _list_json_files(location.path)
         if profile_files:
-            results[location.source] = sorted(profile_files)
+            results[location.source] = profile_files
 
     return results
 
@@ -401,6 +525,7 @@ __all__ = [
     "get_default_orcaslicer_dir",
     "create_config",
     "build_search_path",
+    "clear_search_cache",
     "find_profile_path",
     "resolve_profile_path",
     "list_profiles",
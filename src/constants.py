@@ -738,8 +738,8 @@ FILAMENT_MATERIAL_DEFAULTS = {
 # Default material type for unknown filaments (falls back to PLA)
 DEFAULT_MATERIAL = "PLA"
 
-# List of all standard filament keys
-STANDARD_FILAMENT_KEYS = set(FILAMENT_MATERIAL_DEFAULTS[DEFAULT_MATERIAL].keys())
+# Set of all standard filament keys
+STANDARD_FILAMENT_KEYS = frozenset(FILAMENT_MATERIAL_DEFAULTS[DEFAULT_MATERIAL])
 
 __all__ = [
     "FILAMENT_MATERIAL_DEFAULTS",
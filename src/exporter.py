@@ -1,7 +1,10 @@
 """Profile exporter for OrcaSlicer configurations."""
 
+import functools
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +12,57 @@ from src.constants import DEFAULT_MATERIAL
 from src.constants import FILAMENT_MATERIAL_DEFAULTS
 from src.constants import STANDARD_FILAMENT_KEYS
 
+# Punctuation allowed in exported filenames alongside (unicode) alphanumerics
+# and whitespace
+_SAFE_FILENAME_PUNCTUATION = frozenset("_-.")
+
+# Filenames made only of safe characters and single spaces need no changes
+_CLEAN_FILENAME = re.compile(r"[\w\-. ]+")
+
+# Material -> template defaults restricted to the standard filament keys
+_STANDARD_DEFAULTS: dict[str, dict[str, Any]] = {
+    material: {
+        key: value for key, value in defaults.items() if key in STANDARD_FILAMENT_KEYS
+    }
+    for material, defaults in FILAMENT_MATERIAL_DEFAULTS.items()
+}
+
+# Material name prefix -> template material, e.g. "PA6-CF" -> "PA".
+# No prefix is a prefix of another, so at most one can match.
+_MATERIAL_PREFIXES: dict[str, str] = {
+    "PPA": "PPA-CF",
+    "PPS": "PPS",
+    "PA": "PA",  # PA, PA6, PA6-GF, PA6-CF, etc.
+    "PVA": "PVA",
+    "PETG": "PETG",
+    "PLA": "PLA",
+    "TPU": "TPU",
+    "SBS": "SBS",
+    "PC": "PC",
+    "HIPS": "HIPS",
+    "ASA": "ASA",
+    "ABS": "ABS",
+}
+_MATERIAL_PREFIX_LENGTHS = sorted({len(p) for p in _MATERIAL_PREFIXES}, reverse=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _canonical_material_type(material_type: str) -> str:
+    """
+    Map a normalized (stripped, upper-case) filament type to its template name.
+
+    Args:
+        material_type: Filament type, e.g. "PA6-CF"
+
+    Returns:
+        Template material name, or material_type unchanged if no prefix matches
+    """
+    for length in _MATERIAL_PREFIX_LENGTHS:
+        canonical = _MATERIAL_PREFIXES.get(material_type[:length])
+        if canonical is not None:
+            return canonical
+    return material_type
+
 
 class ExportError(Exception):
     """Exception raised during profile export."""
@@ -65,15 +119,44 @@ class ProfileExporter:
             >>> print(path)  # exports/Test.flattened.json
         """
         try:
-            # Ensure output directory exists
             self.output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise ExportError(
+                f"Failed to export profile '{profile.get('name')}': {e}"
+            ) from e
+
+        return self._export_profile_no_mkdir(profile, filename, source_path)
+
+    def _export_profile_no_mkdir(
+        self,
+        profile: dict[str, Any],
+        filename: str | None = None,
+        source_path: Path | None = None,
+    ) -> Path:
+        """
+        Export a single profile, assuming the output directory exists.
+
+        Batch exports create the directory once up front and call this
+        directly, skipping a mkdir per profile.
+
+        Args:
+            profile: Profile dictionary to export
+            filename: Optional custom filename (without path)
+            source_path: Optional path to source file (used to prevent overwriting)
 
-            # Generate filename if not provided
+        Returns:
+            Absolute path to the exported file
+
+        Raises:
+            ExportError: If export fails or would overwrite source
+        """
+        try:
+            # Generate filename if not provided (generated names are already
+            # sanitized); otherwise sanitize to prevent path traversal
             if filename is None:
                 filename = self._generate_filename(profile)
-
-            # Sanitize filename to prevent path traversal
-            filename = self._sanitize_filename(filename)
+            else:
+                filename = self._sanitize_filename(filename)
 
             # Build full output path
             output_path = self.output_dir / filename
@@ -89,9 +172,13 @@ class ProfileExporter:
             # Populate missing standard keys with material-appropriate defaults
             profile = self._populate_missing_standard_keys(profile)
 
-            # Write JSON to file
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(profile, f, indent=4, ensure_ascii=False)
+            # Serialize in memory and write in one call; json.dump would
+            # issue a write per token. Profiles are parsed JSON and cannot
+            # contain reference cycles, so skip the encoder's cycle tracking.
+            payload = json.dumps(
+                profile, indent=4, ensure_ascii=False, check_circular=False
+            )
+            output_path.write_text(payload, encoding="utf-8")
 
             return output_path
 
@@ -106,7 +193,12 @@ class ProfileExporter:
         self, profiles: list[dict[str, Any]]
     ) -> list[Path]:
         """
-        Export multiple profiles sequentially.
+        Export multiple profiles concurrently.
+
+        Profiles are written on a thread pool since export is I/O bound.
+        Profiles that map to the same output file are written one after
+        another in input order, so the last one wins as in a sequential
+        loop. Returned paths follow the order of the input list.
 
         Args:
             profiles: List of profile dictionaries to export
@@ -114,6 +206,9 @@ class ProfileExporter:
         Returns:
             List of absolute paths to exported files
 
+        Raises:
+            ExportError: If any profile fails to export
+
         Examples:
             >>> profiles = [
             ...     {"name": "Profile 1", "type": "filament"},
@@ -122,7 +217,37 @@ class ProfileExporter:
             >>> exporter = ProfileExporter()
             >>> paths = exporter.export_profiles(profiles)
         """
-        return [self.export_profile(profile) for profile in profiles]
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise ExportError(
+                f"Failed to create output directory '{self.output_dir}': {e}"
+            ) from e
+
+        # Group profiles by output filename; concurrent writes to one file
+        # would interleave and could leave invalid JSON behind
+        groups: dict[str | int, list[int]] = {}
+        for index, profile in enumerate(profiles):
+            try:
+                key: str | int = self._generate_filename(profile)
+            except Exception:
+                # Give it a group of its own; exporting it reports the error
+                key = index
+            groups.setdefault(key, []).append(index)
+
+        def export_group(indexes: list[int]) -> list[tuple[int, Path]]:
+            return [
+                (index, self._export_profile_no_mkdir(profiles[index]))
+                for index in indexes
+            ]
+
+        paths: list[Path] = [Path()] * len(profiles)
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for exported in executor.map(export_group, groups.values()):
+                for index, path in exported:
+                    paths[index] = path
+        return paths
 
     def _get_defaults_for_material(self, filament_type: str) -> dict[str, Any]:
         """
@@ -135,43 +260,21 @@ class ProfileExporter:
             filament_type: Filament type string (e.g., "PA", "PLA", "PETG", "PA6-CF")
 
         Returns:
-            Dictionary of all 58 standard keys with their default values
+            Dictionary of the standard keys with their default values for
+            the material. This is a shared table and must not be mutated.
         """
         # Clean up filament type string
         material_type = str(filament_type).strip().upper() if filament_type else ""
 
-        # Handle common material names and abbreviations
-        # Check these in order of specificity
-        if material_type.startswith("PPA"):
-            material_type = "PPA-CF"
-        elif material_type.startswith("PPS"):
-            material_type = "PPS"
-        elif material_type.startswith("PA"):  # PA, PA6, PA6-GF, PA6-CF, etc.
-            material_type = "PA"
-        elif material_type.startswith("PVA"):
-            material_type = "PVA"
-        elif material_type.startswith("PETG"):
-            material_type = "PETG"
-        elif material_type.startswith("PLA"):
-            material_type = "PLA"
-        elif material_type.startswith("TPU"):
-            material_type = "TPU"
-        elif material_type.startswith("SBS"):
-            material_type = "SBS"
-        elif material_type.startswith("PC"):
-            material_type = "PC"
-        elif material_type.startswith("HIPS"):
-            material_type = "HIPS"
-        elif material_type.startswith("ASA"):
-            material_type = "ASA"
-        elif material_type.startswith("ABS"):
-            material_type = "ABS"
+        # Map common material names and abbreviations to their template
+        material_type = _canonical_material_type(material_type)
 
         # Lookup in material defaults, fall back to default if not found
-        if material_type in FILAMENT_MATERIAL_DEFAULTS:
-            return FILAMENT_MATERIAL_DEFAULTS[material_type].copy()
+        defaults = _STANDARD_DEFAULTS.get(material_type)
+        if defaults is None:
+            defaults = _STANDARD_DEFAULTS[DEFAULT_MATERIAL]
 
-        return FILAMENT_MATERIAL_DEFAULTS[DEFAULT_MATERIAL].copy()
+        return defaults
 
     def _populate_missing_standard_keys(
         self, profile: dict[str, Any]
@@ -209,10 +312,10 @@ class ProfileExporter:
         # Get material-appropriate defaults
         defaults = self._get_defaults_for_material(filament_type)
 
-        # Populate only missing standard keys
-        for key in STANDARD_FILAMENT_KEYS:
-            if key not in profile and key in defaults:
-                profile[key] = defaults[key]
+        # Populate only missing standard keys; defaults hold nothing but
+        # standard keys, so one key-view difference (done in C) finds them
+        for key in defaults.keys() - profile.keys():
+            profile[key] = defaults[key]
 
         return profile
 
@@ -223,7 +326,8 @@ class ProfileExporter:
         Generate filename from profile.
 
         Uses profile name if available, otherwise generates a default name.
-        Adds suffix and .json extension. Sanitizes profile name for safety.
+        Adds suffix and .json extension. The result is passed through
+        _sanitize_filename, so callers don't need to sanitize it again.
 
         Args:
             profile: Profile dictionary
@@ -234,16 +338,22 @@ class ProfileExporter:
         """
         profile_name = profile.get("name", "profile")
 
+        # Fast path: plain string names without path separators
+        if type(profile_name) is str:
+            stripped = profile_name.strip()
+            if "/" not in stripped and "\\" not in stripped:
+                return self._sanitize_filename(f"{stripped}.{suffix}.json")
+
         if isinstance(profile_name, (list, tuple)):
             profile_name = profile_name[0] if profile_name else "profile"
 
         profile_name = str(profile_name).strip()
 
-        # Sanitize profile name to remove invalid characters
+        # Drop path separators from the name itself before the suffix is added
         profile_name = profile_name.replace("/", "")
         profile_name = profile_name.replace("\\", "")
 
-        return f"{profile_name}.{suffix}.json"
+        return self._sanitize_filename(f"{profile_name}.{suffix}.json")
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -261,6 +371,15 @@ class ProfileExporter:
             >>> exporter._sanitize_filename("valid-filename.json")
             "valid-filename.json"
         """
+        # Fast path: most names (e.g. from _generate_filename) are already clean
+        if (
+            filename
+            and filename[0] != "."
+            and "  " not in filename
+            and _CLEAN_FILENAME.fullmatch(filename)
+        ):
+            return filename
+
         # Remove path separators and parent directory references
         filename = filename.replace("../", "")
         filename = filename.replace("..\\", "")
@@ -271,13 +390,19 @@ class ProfileExporter:
         filename = filename.lstrip(".")
 
         # Keep only safe characters: alphanumeric, spaces, dash, underscore,
-        # dot
-        # Allow unicode letters for international filenames
-        safe_pattern = r"[^\w\s\-.]"
-        filename = re.sub(safe_pattern, "", filename, flags=re.UNICODE)
-
-        # Remove multiple spaces
-        filename = re.sub(r"\s+", " ", filename)
+        # dot. Allow unicode letters for international filenames.
+        # Whitespace runs collapse to a single space in the same pass.
+        safe_chars: list[str] = []
+        last_was_space = False
+        for char in filename:
+            if char.isspace():
+                if not last_was_space:
+                    safe_chars.append(" ")
+                    last_was_space = True
+            elif char.isalnum() or char in _SAFE_FILENAME_PUNCTUATION:
+                safe_chars.append(char)
+                last_was_space = False
+        filename = "".join(safe_chars)
 
         # Ensure filename is not empty
         if not filename:
@@ -306,8 +431,10 @@ class ProfileExporter:
         """
         Check if output path would overwrite the source file.
 
-        Compares resolved absolute paths to catch edge cases like symlinks,
-        relative paths, or different path representations of the same file.
+        Compares device and inode numbers via samefile, which catches
+        symlinks, relative paths and other representations of the same
+        file. An output that doesn't exist yet cannot be the source, so the
+        common case costs a single stat.
 
         Args:
             source_path: Path to source profile file
@@ -316,16 +443,17 @@ class ProfileExporter:
         Raises:
             ExportError: If output would overwrite source
         """
-        # Resolve to absolute paths to handle symlinks and relative paths
-        source_abs = source_path.resolve()
-        output_abs = output_path.resolve()
+        try:
+            collides = output_path.exists() and source_path.samefile(output_path)
+        except OSError:
+            # Source is missing or unreadable, so it can't be overwritten
+            collides = False
 
-        # Check if they point to the same file
-        if source_abs == output_abs:
+        if collides:
             raise ExportError(
                 f"Cannot overwrite source profile file!\n"
-                f"  Source: {source_abs}\n"
-                f"  Output would be: {output_abs}\n\n"
+                f"  Source: {source_path.resolve()}\n"
+                f"  Output would be: {output_path.resolve()}\n\n"
                 f"Use --output with a different directory or "
                 f"--output-name with a different filename."
             )
@@ -1,6 +1,8 @@
 """Profile inheritance resolver for OrcaSlicer configurations."""
 
-import copy
+import json
+import os
+import re
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,11 @@ from src.config import ProfileType
 from src.config import build_search_path
 from src.parser import load_profile
 
+# Profiles put "name" near the top, so name lookups only read the head of
+# each file and fall back to a full parse when it isn't there
+_NAME_SCAN_BYTES = 8192
+_NAME_FIELD = re.compile(rb'"name"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
 
 # Custom exceptions
 class ProfileResolverError(Exception):
@@ -27,8 +34,43 @@ class InvalidProfileError(ProfileResolverError):
     """Raised when a profile is invalid."""
 
 
+def _read_profile_name(path: Path) -> str | None:
+    """
+    Read a profile's "name" field without parsing the whole file.
+
+    Args:
+        path: Path to profile JSON file
+
+    Returns:
+        Profile name, or None if the file has no name or can't be read
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(_NAME_SCAN_BYTES)
+        match = _NAME_FIELD.search(head)
+        if match is not None:
+            # Decode JSON escapes in the captured string
+            return json.loads(b'"' + match.group(1) + b'"')
+
+        data = load_profile(path)
+    except (OSError, ValueError):
+        return None
+
+    if isinstance(data, dict):
+        name = data.get("name")
+        if isinstance(name, str):
+            return name
+    return None
+
+
 class ProfileResolver:
-    """Resolves inheritance chains for OrcaSlicer profiles."""
+    """
+    Resolves inheritance chains for OrcaSlicer profiles.
+
+    Parsed profiles are cached per path and reloaded when a file's mtime
+    changes. Parent lookups and profile name indexes are not revalidated,
+    so call clear_cache() after adding, renaming or removing profiles.
+    """
 
     def __init__(self, config: OrcaSlicerConfig) -> None:
         """
@@ -42,8 +84,33 @@ class ProfileResolver:
             >>> config = create_config()
             >>> resolver = ProfileResolver(config)
         """
-        self.config = config
-        self._cache: dict[str, dict[str, Any]] = {}
+        # Parsed profiles (with their mtime) keyed by resolved path, parent
+        # lookups keyed by (parent_name, profile_type), and per-location
+        # profile name indexes; all persist across resolve_profile calls
+        self._cache: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._parent_cache: dict[tuple[str, ProfileType], Path] = {}
+        self._name_index: dict[Path, dict[str, Path]] = {}
+        self._config = config
+
+    @property
+    def config(self) -> OrcaSlicerConfig:
+        """Configuration used to build profile search paths."""
+        return self._config
+
+    @config.setter
+    def config(self, config: OrcaSlicerConfig) -> None:
+        # Parent lookups depend on the search path, so drop them when the
+        # configuration changes; loaded profiles and name indexes are keyed
+        # by path and stay valid
+        if config != self._config:
+            self._parent_cache.clear()
+        self._config = config
+
+    def clear_cache(self) -> None:
+        """Discard cached profiles, parent lookups and name indexes."""
+        self._cache.clear()
+        self._parent_cache.clear()
+        self._name_index.clear()
 
     def resolve_profile(self, profile_path: Path) -> dict[str, Any]:
         """
@@ -53,6 +120,13 @@ class ProfileResolver:
         returning a flattened configuration with all values merged from
         the entire inheritance chain.
 
+        Loaded profiles and parent lookups are cached on the resolver, so
+        profiles sharing ancestors are only read once. Edited profiles are
+        reloaded when their mtime changes; call clear_cache() after adding,
+        renaming or removing profiles. The returned dict is new,
+        but nested values (lists, dicts) are shared with cached profiles
+        and must not be mutated in place.
+
         Args:
             profile_path: Absolute path to profile file to resolve
 
@@ -73,9 +147,6 @@ class ProfileResolver:
             >>> resolved = resolver.resolve_profile(Path("/path/to/profile.json"))
             >>> print(resolved["name"])
         """
-        # Clear cache at start of resolve to avoid stale data
-        self._cache.clear()
-
         # Load the profile
         profile = self._load_profile(profile_path)
 
@@ -89,7 +160,10 @@ class ProfileResolver:
 
     def _load_profile(self, profile_path: Path) -> dict[str, Any]:
         """
-        Load and parse a profile JSON file.
+        Load and parse a profile JSON file, reusing cached results.
+
+        A cached profile is reused while the file's mtime is unchanged. The
+        returned dict is shared with the cache and must not be mutated.
 
         Args:
             profile_path: Path to profile JSON file
@@ -101,7 +175,15 @@ class ProfileResolver:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is invalid
         """
-        return load_profile(profile_path)
+        key = str(profile_path.resolve())
+        mtime = os.stat(key).st_mtime_ns
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        profile = load_profile(profile_path)
+        self._cache[key] = (mtime, profile)
+        return profile
 
     def _get_profile_type(
         self, profile: dict[str, Any], profile_path: Path | None = None
@@ -160,7 +242,34 @@ class ProfileResolver:
 
         Searches for a profile in priority order: user, system, samples.
         First tries exact filename match, then searches for a profile
-        with matching "name" field in JSON.
+        with matching "name" field in JSON. Found paths are cached per
+        (parent_name, profile_type).
+
+        Args:
+            parent_name: Name of parent profile to find
+                (with or without .json extension)
+            profile_type: Type of profile (filament, machine, process)
+
+        Returns:
+            Absolute path to parent profile
+
+        Raises:
+            ProfileNotFoundError: If parent cannot be found
+        """
+        cache_key = (parent_name, profile_type)
+        cached = self._parent_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        parent_path = self._search_parent_profile(parent_name, profile_type)
+        self._parent_cache[cache_key] = parent_path
+        return parent_path
+
+    def _search_parent_profile(
+        self, parent_name: str, profile_type: ProfileType
+    ) -> Path:
+        """
+        Search the profile locations for a parent profile.
 
         Args:
             parent_name: Name of parent profile to find
@@ -180,35 +289,58 @@ class ProfileResolver:
             filename = f"{parent_name}.json"
         else:
             filename = parent_name
+        parent_without_ext = parent_name.replace(".json", "")
 
         # Search each location in priority order
         for location in search_path.locations:
-            if not location.path.exists():
+            # One stat covers the old exists() and is_dir() checks: a
+            # location that isn't a directory can't contain the parent
+            location_str = os.fspath(location.path)
+            if not os.path.isdir(location_str):
                 continue
 
             # Try exact filename match first
-            candidate = location.path / filename
-            if candidate.exists():
-                return candidate
-
-            # Try recursive search for profile by name field
-            if location.path.is_dir():
-                for json_file in location.path.rglob("*.json"):
-                    try:
-                        data = load_profile(json_file)
-                        # Match by "name" field or parent_name without extension
-                        profile_name = data.get("name")
-                        parent_without_ext = parent_name.replace(".json", "")
-                        if profile_name in (parent_name, parent_without_ext):
-                            return json_file
-                    except (FileNotFoundError, ValueError):
-                        # Skip files that can't be loaded
-                        continue
+            candidate = os.path.join(location_str, filename)
+            if os.path.exists(candidate):
+                return Path(candidate)
+
+            # Fall back to matching the "name" field of any profile below
+            index = self._get_name_index(location.path)
+            match = index.get(parent_name) or index.get(parent_without_ext)
+            if match is not None:
+                return match
 
         raise ProfileNotFoundError(
             f"Parent profile not found: {parent_name}"
         )
 
+    def _get_name_index(self, directory: Path) -> dict[str, Path]:
+        """
+        Map profile "name" fields to files for every profile below directory.
+
+        The directory is scanned and parsed once; later lookups reuse the
+        index until clear_cache() is called. When several files share a
+        name, the first one found wins.
+
+        Args:
+            directory: Search location to index
+
+        Returns:
+            Dictionary of profile name to profile path
+        """
+        index = self._name_index.get(directory)
+        if index is not None:
+            return index
+
+        index = {}
+        for json_file in directory.rglob("*.json"):
+            name = _read_profile_name(json_file)
+            if name is not None:
+                index.setdefault(name, json_file)
+
+        self._name_index[directory] = index
+        return index
+
     def _merge_profiles(
         self, parent: dict[str, Any], child: dict[str, Any]
     ) -> dict[str, Any]:
@@ -216,7 +348,8 @@ class ProfileResolver:
         Merge child profile into parent profile.
 
         Child settings override parent settings. Arrays are replaced,
-        not appended. Creates a deep copy to avoid mutating inputs.
+        not appended. Returns a new top-level dict so neither input is
+        mutated; nested values are shared with the inputs, not copied.
 
         Args:
             parent: Parent profile (base)
@@ -234,32 +367,25 @@ class ProfileResolver:
             >>> merged["speed"]
             50
         """
-        # Create deep copy of parent to avoid mutation
-        merged = copy.deepcopy(parent)
-
-        # Override with child values
-        for key, value in child.items():
-            merged[key] = copy.deepcopy(value)
-
+        merged = dict(parent)
+        merged.update(child)
         return merged
 
     def _resolve_inheritance_chain(
         self,
         profile: dict[str, Any],
         profile_type: ProfileType,
-        visited: set[str] | None = None,
     ) -> dict[str, Any]:
         """
-        Recursively resolve inheritance chain and merge settings.
+        Resolve inheritance chain and merge settings.
 
-        Traverses up the inheritance tree to the root, then merges
-        down (root -> leaf) so child settings override parent settings.
-        Detects circular inheritance.
+        Walks up the inheritance chain to the root, then merges down
+        (root -> leaf) into a single dict so child settings override
+        parent settings. Detects circular inheritance.
 
         Args:
             profile: Profile to resolve
             profile_type: Type of profile
-            visited: Set of visited profile names (for circular detection)
 
         Returns:
             Fully resolved profile with all inherited settings merged
@@ -268,34 +394,30 @@ class ProfileResolver:
             CircularInheritanceError: If circular inheritance detected
             ProfileNotFoundError: If parent profile not found
         """
-        if visited is None:
-            visited = set()
-
-        profile_name = profile.get("name", "unknown")
-
-        # Detect circular inheritance
-        if profile_name in visited:
-            chain = " -> ".join(list(visited) + [profile_name])
-            raise CircularInheritanceError(f"Circular inheritance detected: {chain}")
-
-        visited.add(profile_name)
-
-        # Base case: no inheritance
-        if "inherits" not in profile:
-            return copy.deepcopy(profile)
-
-        # Recursive case: resolve parent first
-        parent_name = profile["inherits"]
-        parent_path = self._find_parent_profile(parent_name, profile_type)
-        parent_profile = self._load_profile(parent_path)
-
-        # Recursively resolve parent's inheritance chain
-        resolved_parent = self._resolve_inheritance_chain(
-            parent_profile, profile_type, visited.copy()
-        )
-
-        # Merge current profile into resolved parent (child overrides parent)
-        return self._merge_profiles(resolved_parent, profile)
+        # Collect the chain leaf -> root, tracking names for cycle detection
+        chain = [profile]
+        names = [profile.get("name", "unknown")]
+        seen = set(names)
+        current = profile
+        while "inherits" in current:
+            parent_path = self._find_parent_profile(current["inherits"], profile_type)
+            current = self._load_profile(parent_path)
+
+            current_name = current.get("name", "unknown")
+            if current_name in seen:
+                chain_str = " -> ".join(names + [current_name])
+                raise CircularInheritanceError(
+                    f"Circular inheritance detected: {chain_str}"
+                )
+            seen.add(current_name)
+            names.append(current_name)
+            chain.append(current)
+
+        # Merge root -> leaf so each child overrides its parents
+        merged: dict[str, Any] = {}
+        for level in reversed(chain):
+            merged.update(level)
+        return merged
 
 
 __all__ = [
@@ -1,67 +1,94 @@
 """Profile validation module for OrcaSlicer configurations."""
 
 import json
+import os
+import threading
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
+from typing import Any
+from typing import Callable
 from typing import Literal
 from typing import Optional
 
+# Prefer a faster JSON decoder when one is installed; all of them accept
+# the raw bytes of a file
+try:
+    from orjson import loads as _fast_loads
+except ImportError:
+    try:
+        from ujson import loads as _fast_loads
+    except ImportError:
+        from json import loads as _fast_loads
+
 # Constants
-OBSOLETE_KEYS: set[str] = {
-    "acceleration",
-    "scale",
-    "rotate",
-    "duplicate",
-    "duplicate_grid",
-    "bed_size",
-    "print_center",
-    "g0",
-    "wipe_tower_per_color_wipe",
-    "support_sharp_tails",
-    "support_remove_small_overhangs",
-    "support_with_sheath",
-    "tree_support_collision_resolution",
-    "tree_support_with_infill",
-    "max_volumetric_speed",
-    "max_print_speed",
-    "support_closing_radius",
-    "remove_freq_sweep",
-    "remove_bed_leveling",
-    "remove_extrusion_calibration",
-    "support_transition_line_width",
-    "support_transition_speed",
-    "bed_temperature",
-    "bed_temperature_initial_layer",
-    "can_switch_nozzle_type",
-    "can_add_auxiliary_fan",
-    "extra_flush_volume",
-    "spaghetti_detector",
-    "adaptive_layer_height",
-    "z_hop_type",
-    "z_lift_type",
-    "bed_temperature_difference",
-    "long_retraction_when_cut",
-    "retraction_distance_when_cut",
-    "extruder_type",
-    "internal_bridge_support_thickness",
-    "extruder_clearance_max_radius",
-    "top_area_threshold",
-    "reduce_wall_solid_infill",
-    "filament_load_time",
-    "filament_unload_time",
-    "smooth_coefficient",
-    "overhang_totally_speed",
-    "silent_mode",
-    "overhang_speed_classic",
-}
+OBSOLETE_KEYS: frozenset[str] = frozenset(
+    {
+        "acceleration",
+        "scale",
+        "rotate",
+        "duplicate",
+        "duplicate_grid",
+        "bed_size",
+        "print_center",
+        "g0",
+        "wipe_tower_per_color_wipe",
+        "support_sharp_tails",
+        "support_remove_small_overhangs",
+        "support_with_sheath",
+        "tree_support_collision_resolution",
+        "tree_support_with_infill",
+        "max_volumetric_speed",
+        "max_print_speed",
+        "support_closing_radius",
+        "remove_freq_sweep",
+        "remove_bed_leveling",
+        "remove_extrusion_calibration",
+        "support_transition_line_width",
+        "support_transition_speed",
+        "bed_temperature",
+        "bed_temperature_initial_layer",
+        "can_switch_nozzle_type",
+        "can_add_auxiliary_fan",
+        "extra_flush_volume",
+        "spaghetti_detector",
+        "adaptive_layer_height",
+        "z_hop_type",
+        "z_lift_type",
+        "bed_temperature_difference",
+        "long_retraction_when_cut",
+        "retraction_distance_when_cut",
+        "extruder_type",
+        "internal_bridge_support_thickness",
+        "extruder_clearance_max_radius",
+        "top_area_threshold",
+        "reduce_wall_solid_infill",
+        "filament_load_time",
+        "filament_unload_time",
+        "smooth_coefficient",
+        "overhang_totally_speed",
+        "silent_mode",
+        "overhang_speed_classic",
+    }
+)
 
 CONFLICT_KEYS: list[list[str]] = [
     ["extruder_clearance_radius", "extruder_clearance_max_radius"],
 ]
 
+# JSON files in filament directories that aren't filament profiles
+_NON_PROFILE_FILES = frozenset({"filaments_color_codes.json"})
+
+# Sections of a vendor index file that list profiles by name and sub_path
+_VENDOR_INDEX_SECTIONS = (
+    "filament_list",
+    "machine_model_list",
+    "machine_list",
+    "process_list",
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """Single validation issue."""
 
@@ -70,7 +97,7 @@ class ValidationIssue:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation run."""
 
@@ -90,17 +117,17 @@ class ValidationResult:
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return self.error_count > 0
 
     @property
     def error_count(self) -> int:
         """Get count of errors."""
-        return len(self.errors)
+        return sum(1 for i in self.issues if i.level == "error")
 
     @property
     def warning_count(self) -> int:
         """Get count of warnings."""
-        return len(self.warnings)
+        return sum(1 for i in self.issues if i.level == "warning")
 
     def merge(self, other: "ValidationResult") -> "ValidationResult":
         """
@@ -117,6 +144,91 @@ class ValidationResult:
             files_checked=self.files_checked + other.files_checked,
         )
 
+    def extend(self, other: "ValidationResult") -> None:
+        """
+        Add another validation result's issues and file count in place.
+
+        Unlike merge(), no new result or issue list is created, so folding
+        many results into one accumulator stays linear.
+
+        Args:
+            other: Another ValidationResult to add
+        """
+        self.issues.extend(other.issues)
+        self.files_checked += other.files_checked
+
+
+@dataclass(slots=True)
+class _FilamentProfile:
+    """Filament profile loaded for the compatible_printers check."""
+
+    file_path: Path
+    content: dict[str, Any]
+    instantiation: bool
+
+
+def _find_json_files(root: Path) -> list[Path]:
+    """
+    Recursively list the .json files below a directory.
+
+    Walks with os.scandir, whose entries carry their file type, so no extra
+    stat calls are needed. Results are sorted so reports come out in the
+    same order on every platform. Symlinked directories are not followed.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted paths of the .json files found (empty if root is missing)
+    """
+    json_files: list[str] = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        json_files.append(entry.path)
+        except OSError:
+            pass
+
+    return sorted(map(Path, json_files))
+
+
+def _reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """
+    Build a JSON object, raising if any key occurs more than once.
+
+    Used as json's object_pairs_hook. Objects without duplicates take only
+    C-level set and dict construction; the key is located in Python only
+    when reporting an error.
+
+    Args:
+        pairs: Key/value pairs of one JSON object, in document order
+
+    Returns:
+        Dictionary built from the pairs
+
+    Raises:
+        ValueError: If a key is duplicated
+    """
+    obj = dict(pairs)
+    if len(obj) != len(pairs):
+        seen: set[str] = set()
+        for key, _ in pairs:
+            if key in seen:
+                raise ValueError(f"Duplicate key detected: {key}")
+            seen.add(key)
+    return obj
+
+
+# Shared decoder for duplicate-checked loads; json.load would build a new
+# JSONDecoder for every file since a hook is passed
+_DUPLICATE_CHECK_DECODER = json.JSONDecoder(object_pairs_hook=_reject_duplicate_keys)
+
 
 def load_json_with_duplicate_check(file_path: Path) -> dict:  # type: ignore
     """
@@ -132,27 +244,55 @@ def load_json_with_duplicate_check(file_path: Path) -> dict:  # type: ignore
         ValueError: If duplicate keys are found
         json.JSONDecodeError: If JSON is invalid
     """
+    text = file_path.read_text(encoding="utf-8")
+    if text.startswith("\ufeff"):
+        # Match json.loads, which rejects a BOM in decoded text
+        raise json.JSONDecodeError(
+            "Unexpected UTF-8 BOM (decode using utf-8-sig)", text, 0
+        )
+    return _DUPLICATE_CHECK_DECODER.decode(text)
 
-    def no_duplicates_hook(pairs):  # type: ignore
-        """Hook to detect duplicate keys during JSON parsing."""
-        seen = {}
-        for key, value in pairs:
-            if key in seen:
-                raise ValueError(f"Duplicate key detected: {key}")
-            seen[key] = value
-        return seen
 
-    with file_path.open("r", encoding="utf-8") as f:
-        return json.load(f, object_pairs_hook=no_duplicates_hook)
+def _read_json_bytes(file_path: Path, loads: Callable[[bytes], Any]) -> Any:
+    """
+    Decode a JSON file's raw bytes with the given decoder.
 
+    Byte-level decoders accept a UTF-8 BOM that text-mode json.load rejects,
+    so it's refused here to keep behavior the same.
 
-def load_available_filament_profiles(profiles_dir: Path, vendor_name: str) -> set[str]:
+    Args:
+        file_path: Path to JSON file
+        loads: JSON decoder for the raw file bytes
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file starts with a BOM or JSON is invalid
+    """
+    data = file_path.read_bytes()
+    if data.startswith(b"\xef\xbb\xbf"):
+        raise json.JSONDecodeError(
+            "Unexpected UTF-8 BOM (decode using utf-8-sig)",
+            data.decode("utf-8", errors="replace"),
+            0,
+        )
+    return loads(data)
+
+
+def load_available_filament_profiles(
+    profiles_dir: Path,
+    vendor_name: str,
+    loads: Callable[[bytes], Any] = _fast_loads,
+) -> set[str]:
     """
     Load all available filament profile names from a vendor.
 
     Args:
         profiles_dir: Base profiles directory
         vendor_name: Vendor name to check
+        loads: JSON decoder for the raw file bytes (default: orjson or ujson
+            if installed, otherwise json.loads)
 
     Returns:
         Set of filament profile names
@@ -163,12 +303,11 @@ def load_available_filament_profiles(profiles_dir: Path, vendor_name: str) -> se
     if not vendor_path.exists():
         return profiles
 
-    for file_path in vendor_path.rglob("*.json"):
+    for file_path in _find_json_files(vendor_path):
         try:
-            with file_path.open("r", encoding="utf-8") as fp:
-                data = json.load(fp)
-                if "name" in data:
-                    profiles.add(data["name"])
+            data = _read_json_bytes(file_path, loads)
+            if "name" in data:
+                profiles.add(data["name"])
         except Exception:
             pass
 
@@ -181,8 +320,9 @@ class ProfileValidator:
     def __init__(
         self,
         profiles_dir: Path,
-        obsolete_keys: set[str] | None = None,
+        obsolete_keys: set[str] | frozenset[str] | None = None,
         conflict_keys: list[list[str]] | None = None,
+        loads: Callable[[bytes], Any] = _fast_loads,
     ) -> None:
         """
         Initialize ProfileValidator.
@@ -191,10 +331,160 @@ class ProfileValidator:
             profiles_dir: Base profiles directory
             obsolete_keys: Set of obsolete key names to check (default: OBSOLETE_KEYS)
             conflict_keys: List of conflicting key pairs (default: CONFLICT_KEYS)
+            loads: JSON decoder for the raw file bytes in checks that don't
+                need duplicate-key detection (default: orjson or ujson if
+                installed, otherwise json.loads)
         """
         self.profiles_dir = profiles_dir
-        self.obsolete_keys = obsolete_keys or OBSOLETE_KEYS
+        self.obsolete_keys = (
+            frozenset(obsolete_keys) if obsolete_keys else OBSOLETE_KEYS
+        )
         self.conflict_keys = conflict_keys or CONFLICT_KEYS
+        self.loads = loads
+        # Parsed files and directory listings, kept per thread so workers
+        # sharing a validator don't write to the same dicts
+        self._local = threading.local()
+        # Filament profile names per vendor, for default material checks
+        self._filament_names: dict[str, frozenset[str]] = {}
+        self._names_lock = threading.Lock()
+
+    @property
+    def _cache(self) -> dict[Path, tuple[int, Any, bool]]:
+        """Parsed files keyed by path: (mtime_ns, data, duplicate_checked)."""
+        try:
+            return self._local.cache
+        except AttributeError:
+            self._local.cache = {}
+            return self._local.cache
+
+    @property
+    def _file_lists(self) -> dict[Path, list[Path]]:
+        """The .json files found below each walked directory."""
+        try:
+            return self._local.file_lists
+        except AttributeError:
+            self._local.file_lists = {}
+            return self._local.file_lists
+
+    def _clear_file_caches(self) -> None:
+        """Discard the calling thread's parsed files and directory listings."""
+        self._cache.clear()
+        self._file_lists.clear()
+
+    def clear_cache(self) -> None:
+        """Discard cached parsed files, directory listings and names."""
+        self._clear_file_caches()
+        with self._names_lock:
+            self._filament_names.clear()
+
+    def _json_files(
+        self, directory: Path, skip: frozenset[str] = frozenset()
+    ) -> list[Path]:
+        """
+        List the .json files below a directory, reusing an earlier walk.
+
+        The filament checks all read the same tree, so it is walked once
+        per validate_all() call; call clear_cache() if files are added or
+        removed between direct calls to the individual checks.
+
+        Args:
+            directory: Directory to search
+            skip: File names to leave out of the listing
+
+        Returns:
+            Sorted paths of the .json files found
+        """
+        files = self._file_lists.get(directory)
+        if files is None:
+            files = _find_json_files(directory)
+            self._file_lists[directory] = files
+        if skip:
+            return [path for path in files if path.name not in skip]
+        return files
+
+    def _load_json(self, file_path: Path) -> Any:
+        """
+        Load a JSON file with the configured decoder.
+
+        Args:
+            file_path: Path to JSON file
+
+        Returns:
+            Parsed JSON data
+
+        Raises:
+            json.JSONDecodeError: If the file starts with a BOM or JSON is invalid
+        """
+        return _read_json_bytes(file_path, self.loads)
+
+    def _load_cached(self, file_path: Path, check_duplicates: bool = False) -> Any:
+        """
+        Load a JSON file, reusing the parse from an earlier check.
+
+        Results are cached per path and reused while the file's mtime is
+        unchanged. A result parsed with duplicate-key detection also serves
+        plain loads, but not the other way round. Failed loads aren't cached.
+
+        Args:
+            file_path: Path to JSON file
+            check_duplicates: Whether to reject objects with duplicate keys
+
+        Returns:
+            Parsed JSON data, shared with the cache (must not be mutated)
+
+        Raises:
+            ValueError: If check_duplicates is set and duplicate keys are found
+            json.JSONDecodeError: If JSON is invalid
+        """
+        mtime = file_path.stat().st_mtime_ns
+        cached = self._cache.get(file_path)
+        if cached is not None:
+            cached_mtime, data, duplicate_checked = cached
+            if cached_mtime == mtime and (duplicate_checked or not check_duplicates):
+                return data
+
+        if check_duplicates:
+            data = load_json_with_duplicate_check(file_path)
+        else:
+            data = self._load_json(file_path)
+
+        self._cache[file_path] = (mtime, data, check_duplicates)
+        return data
+
+    def _get_filament_names(self, vendor_name: str) -> frozenset[str]:
+        """
+        Get a vendor's filament profile names, loading them once.
+
+        Same result as load_available_filament_profiles(), but the names are
+        kept per vendor and files are read through the parsed-file cache, so
+        the shared OrcaFilamentLibrary isn't reloaded for every vendor.
+
+        Args:
+            vendor_name: Vendor name to load
+
+        Returns:
+            Frozen set of filament profile names
+        """
+        # Held while loading so concurrent vendors read the library once
+        with self._names_lock:
+            names = self._filament_names.get(vendor_name)
+            if names is not None:
+                return names
+
+            found: set[str] = set()
+            vendor_path = self.profiles_dir / vendor_name / "filament"
+            if vendor_path.exists():
+                for file_path in self._json_files(vendor_path):
+                    try:
+                        data = self._load_cached(file_path)
+                        if "name" in data:
+                            found.add(data["name"])
+                    except Exception:
+                        pass
+
+            names = frozenset(found)
+            self._filament_names[vendor_name] = names
+            return names
 
     def validate_filament_compatible_printers(
         self, vendor_name: str
@@ -214,15 +504,12 @@ class ProfileValidator:
         if not vendor_path.exists():
             return result
 
-        profiles = {}
+        profiles: dict[str, _FilamentProfile] = {}
 
         # Load all profiles
-        for file_path in vendor_path.rglob("*.json"):
-            if file_path.name == "filaments_color_codes.json":
-                continue
-
+        for file_path in self._json_files(vendor_path, skip=_NON_PROFILE_FILES):
             try:
-                data = load_json_with_duplicate_check(file_path)
+                data = self._load_cached(file_path, check_duplicates=True)
             except Exception as e:
                 result.issues.append(
                     ValidationIssue(
@@ -247,38 +534,29 @@ class ProfileValidator:
                 )
                 continue
 
-            profiles[profile_name] = {"file_path": file_path, "content": data}
+            # Normalize "instantiation" ("true"/"True"/true) once at load
+            instantiation = data.get("instantiation")
+            profiles[profile_name] = _FilamentProfile(
+                file_path,
+                data,
+                instantiation is True
+                or (isinstance(instantiation, str) and instantiation.lower() == "true"),
+            )
 
         result.files_checked = len(profiles)
 
         # Helper functions for inheritance resolution
         def get_property(profile, key):  # type: ignore
             """Get property from profile."""
-            content = profile["content"]
+            content = profile.content
             if key in content:
                 return content[key]
             return None
 
-        def get_inherit_property(profile, key):  # type: ignore
-            """Get property with inheritance resolution."""
-            content = profile["content"]
-            if key in content:
-                return content[key]
-
-            if "inherits" in content:
-                inherits = content["inherits"]
-                if inherits not in profiles:
-                    raise ValueError(f"Parent profile not found: {inherits}")
-                return get_inherit_property(profiles[inherits], key)
-
-            return None
-
         # Validate each profile
         for profile in profiles.values():
-            profile_file_path: Path = profile["file_path"]  # type: ignore
-            profile_content: dict = profile["content"]  # type: ignore
-            instantiation = str(profile_content.get("instantiation", "")).lower() == "true"
-            if instantiation:
+            profile_file_path = profile.file_path
+            if profile.instantiation:
                 try:
                     compatible_printers = get_property(profile, "compatible_printers")
                     if not compatible_printers or (
@@ -319,17 +597,14 @@ class ProfileValidator:
             return result
 
         # Load available filaments
-        vendor_filaments = load_available_filament_profiles(self.profiles_dir, vendor_name)
-        global_filaments = load_available_filament_profiles(
-            self.profiles_dir, "OrcaFilamentLibrary"
-        )
-        all_available = vendor_filaments.union(global_filaments)
+        vendor_filaments = self._get_filament_names(vendor_name)
+        global_filaments = self._get_filament_names("OrcaFilamentLibrary")
+        all_available = vendor_filaments | global_filaments
 
         # Check each machine profile
-        for file_path in machine_dir.rglob("*.json"):
+        for file_path in self._json_files(machine_dir):
             try:
-                with file_path.open("r", encoding="utf-8") as fp:
-                    data = json.load(fp)
+                data = self._load_cached(file_path)
             except Exception:
                 continue
 
@@ -343,15 +618,7 @@ class ProfileValidator:
 
             if default_materials:
                 if isinstance(default_materials, list):
-                    for material in default_materials:
-                        if material not in all_available:
-                            result.issues.append(
-                                ValidationIssue(
-                                    level="error",
-                                    message=f"Missing filament: {material}",
-                                    file_path=file_path,
-                                )
-                            )
+                    materials_list = default_materials
                 else:
                     # Handle semicolon-separated string
                     materials_list = [
@@ -359,15 +626,21 @@ class ProfileValidator:
                         for m in default_materials.split(";")
                         if m.strip()
                     ]
-                    for material in materials_list:
-                        if material not in all_available:
-                            result.issues.append(
-                                ValidationIssue(
-                                    level="error",
-                                    message=f"Missing filament: {material}",
-                                    file_path=file_path,
-                                )
+
+                # Usually every material exists; issuperset() confirms that
+                # in C, and only otherwise are they walked in order
+                if all_available.issuperset(materials_list):
+                    continue
+
+                for material in materials_list:
+                    if material not in all_available:
+                        result.issues.append(
+                            ValidationIssue(
+                                level="error",
+                                message=f"Missing filament: {material}",
+                                file_path=file_path,
                             )
+                        )
 
         return result
 
@@ -389,8 +662,7 @@ class ProfileValidator:
             return result
 
         try:
-            with vendor_file.open("r", encoding="utf-8") as fp:
-                data = json.load(fp)
+            data = self._load_cached(vendor_file)
         except Exception as e:
             result.issues.append(
                 ValidationIssue(
@@ -401,7 +673,7 @@ class ProfileValidator:
             )
             return result
 
-        for section in ["filament_list", "machine_model_list", "machine_list", "process_list"]:
+        for section in _VENDOR_INDEX_SECTIONS:
             if section not in data:
                 continue
 
@@ -421,8 +693,7 @@ class ProfileValidator:
                     continue
 
                 try:
-                    with sub_file.open("r", encoding="utf-8") as fp:
-                        sub_data = json.load(fp)
+                    sub_data = self._load_cached(sub_file)
                 except Exception as e:
                     result.issues.append(
                         ValidationIssue(
@@ -468,9 +739,9 @@ class ProfileValidator:
         if not vendor_path.exists():
             return result
 
-        for file_path in vendor_path.rglob("*.json"):
+        for file_path in self._json_files(vendor_path):
             try:
-                data = load_json_with_duplicate_check(file_path)
+                data = self._load_cached(file_path, check_duplicates=True)
             except Exception:
                 continue
 
@@ -505,15 +776,20 @@ class ProfileValidator:
         if not vendor_path.exists():
             return result
 
-        for file_path in vendor_path.rglob("*.json"):
+        for file_path in self._json_files(vendor_path):
             try:
-                with file_path.open("r", encoding="utf-8") as fp:
-                    data = json.load(fp)
+                data = self._load_cached(file_path)
             except Exception:
                 continue
 
             result.files_checked += 1
 
+            # Most profiles have no obsolete keys; isdisjoint() rules them
+            # out in C before walking the keys in file order. On a keys view
+            # it probes whichever side is smaller.
+            if data.keys().isdisjoint(self.obsolete_keys):
+                continue
+
             for key in data.keys():
                 if key in self.obsolete_keys:
                     result.issues.append(
@@ -542,17 +818,31 @@ class ProfileValidator:
         if not vendor_path.exists():
             return result
 
-        for file_path in vendor_path.rglob("*.json"):
+        # Frozen copies of each key set, plus their union so profiles with
+        # none of the keys are skipped by a single C-level check
+        conflict_sets = [
+            (key_set, frozenset(key_set)) for key_set in self.conflict_keys
+        ]
+        any_conflict_key = frozenset().union(*self.conflict_keys)
+
+        for file_path in self._json_files(vendor_path):
             try:
-                data = load_json_with_duplicate_check(file_path)
+                data = self._load_cached(file_path, check_duplicates=True)
             except Exception:
                 continue
 
             result.files_checked += 1
 
-            for key_set in self.conflict_keys:
-                found_count = sum(1 for k in key_set if k in data)
-                if found_count > 1:
+            if isinstance(data, dict):
+                # On a keys view, isdisjoint() probes the few conflict keys
+                # against the profile rather than every profile key
+                if data.keys().isdisjoint(any_conflict_key):
+                    continue
+            elif any_conflict_key.isdisjoint(data):
+                continue
+
+            for key_set, keys in conflict_sets:
+                if len(keys.intersection(data)) > 1:
                     result.issues.append(
                         ValidationIssue(
                             level="error",
@@ -573,6 +863,10 @@ class ProfileValidator:
         """
         Run all validations and combine results.
 
+        Parsed files are shared between the checks and dropped afterwards,
+        so memory stays bounded by one vendor's tree; filament names are
+        kept for later vendors. Safe to call from several threads at once.
+
         Args:
             vendor_name: Vendor name to validate
             check_filaments: Whether to check filament compatible_printers
@@ -584,24 +878,29 @@ class ProfileValidator:
         """
         results: list[ValidationResult] = []
 
-        if check_filaments:
-            results.append(self.validate_filament_compatible_printers(vendor_name))
+        try:
+            if check_filaments:
+                results.append(
+                    self.validate_filament_compatible_printers(vendor_name)
+                )
 
-        if check_materials:
-            results.append(self.validate_machine_default_materials(vendor_name))
+            if check_materials:
+                results.append(self.validate_machine_default_materials(vendor_name))
 
-        # Always run these
-        results.append(self.validate_name_consistency(vendor_name))
-        results.append(self.validate_conflict_keys(vendor_name))
-        results.append(self.validate_filament_id(vendor_name))
+            # Always run these
+            results.append(self.validate_name_consistency(vendor_name))
+            results.append(self.validate_conflict_keys(vendor_name))
+            results.append(self.validate_filament_id(vendor_name))
 
-        if check_obsolete:
-            results.append(self.validate_obsolete_keys(vendor_name))
+            if check_obsolete:
+                results.append(self.validate_obsolete_keys(vendor_name))
+        finally:
+            self._clear_file_caches()
 
         # Merge all results
         merged = ValidationResult()
         for result in results:
-            merged = merged.merge(result)
+            merged.extend(result)
 
         return merged
 
@@ -1,20 +1,97 @@
 """Tests for OrcaSlicer profile exporter CLI module."""
 
 import json
+import os
 from pathlib import Path
 
+import click
+import pytest
 from click.testing import CliRunner
 
 from src.cli import cli
+from src.cli import export
+
+# Canonical minimal profiles as literal JSON bytes
+_MINIMAL_PROFILE_BYTES = b'{"name": "Test", "type": "filament"}'
+_MINIMAL_WITH_TEMP_BYTES = b'{"name": "Test", "type": "filament", "temperature": 200}'
+
+
+def _export_args(
+    profile: str | os.PathLike[str],
+    *extra: str,
+    output: str | os.PathLike[str] | None = None,
+) -> list[str]:
+    """
+    Build the argument list for an export command.
+
+    Args:
+        profile: Profile file to export
+        *extra: Additional arguments appended after the output option
+        output: Output directory passed as --output, if any
+
+    Returns:
+        Command-line arguments for the CLI
+    """
+    args = ["export", os.fspath(profile)]
+    if output is not None:
+        args += ["--output", os.fspath(output)]
+    args += extra
+    return args
+
+
+def _invoke_quietly(args: list[str]) -> int:
+    """
+    Run the CLI without CliRunner's output capture.
+
+    For tests that only check the exit code and files on disk.
+
+    Args:
+        args: Command-line arguments passed to the CLI
+
+    Returns:
+        Exit code the command would have produced
+    """
+    try:
+        cli.main(args, standalone_mode=False)
+    except click.ClickException as e:
+        return e.exit_code
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Provide a CliRunner shared by every test in this module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def profile_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Provide the canonical minimal profile, written once per session.
+
+    Exports only read the profile, so tests share it; anything a test
+    writes goes to its own tmp_path.
+    """
+    path = tmp_path_factory.mktemp("profiles") / "test.json"
+    path.write_bytes(_MINIMAL_PROFILE_BYTES)
+    return path
+
+
+@pytest.fixture
+def output_dir(tmp_path: Path) -> Path:
+    """Provide an existing export directory inside tmp_path."""
+    path = tmp_path / "exports"
+    path.mkdir()
+    return path
 
 
 class TestCLICommandExport:
     """Test CLI export command."""
 
-    def test_export_with_file_path(self, tmp_path: Path) -> None:
+    def test_export_with_file_path(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test exporting profile with full file path."""
-        runner = CliRunner()
-
         # Create a test profile
         profile_path = tmp_path / "test.json"
         profile_data = {
@@ -22,81 +99,53 @@ class TestCLICommandExport:
             "type": "filament",
             "temperature": 200,
         }
-        profile_path.write_text(json.dumps(profile_data))
+        profile_path.write_bytes(json.dumps(profile_data).encode())
 
         # Export
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(tmp_path)],
-        )
+        result = runner.invoke(cli, _export_args(profile_path, output=tmp_path))
 
         assert result.exit_code == 0
         assert "exported" in result.output.lower() or "success" in result.output.lower()
 
-    def test_export_creates_output_directory(self, tmp_path: Path) -> None:
+    def test_export_creates_output_directory(
+        self, tmp_path: Path, profile_path: Path
+    ) -> None:
         """Test that export creates output directory if missing."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
         output_dir = tmp_path / "exports" / "nested"
 
         # Export
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(output_dir)],
-        )
+        exit_code = _invoke_quietly(_export_args(profile_path, output=output_dir))
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert output_dir.exists()
 
-    def test_export_with_custom_output_filename(self, tmp_path: Path) -> None:
+    def test_export_with_custom_output_filename(
+        self, profile_path: Path, output_dir: Path
+    ) -> None:
         """Test export with custom output filename."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
         # Export with custom name
-        result = runner.invoke(
-            cli,
-            [
-                "export",
-                str(profile_path),
-                "--output",
-                str(output_dir),
-                "--output-name",
-                "custom.json",
-            ],
+        exit_code = _invoke_quietly(
+            _export_args(
+                profile_path, "--output-name", "custom.json", output=output_dir
+            ),
         )
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert (output_dir / "custom.json").exists()
 
-    def test_export_missing_profile_fails(self, tmp_path: Path) -> None:
+    def test_export_missing_profile_fails(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
         """Test that exporting non-existent profile fails."""
-        runner = CliRunner()
-
-        result = runner.invoke(
-            cli,
-            ["export", str(tmp_path / "missing.json")],
-        )
+        result = runner.invoke(cli, _export_args(tmp_path / "missing.json"))
 
         assert result.exit_code != 0
         assert "not found" in result.output.lower() or "error" in result.output.lower()
 
-    def test_export_with_complex_profile(self, tmp_path: Path) -> None:
+    def test_export_with_complex_profile(
+        self, runner: CliRunner, tmp_path: Path, output_dir: Path
+    ) -> None:
         """Test exporting profile with many fields."""
-        runner = CliRunner()
-
         # Create complex profile (no inheritance)
         profile_path = tmp_path / "complex.json"
         profile_data = {
@@ -108,89 +157,60 @@ class TestCLICommandExport:
             "filament_density": ["1.25"],
             "compatible_printers": ["Printer1", "Printer2"],
         }
-        profile_path.write_text(json.dumps(profile_data))
+        profile_path.write_bytes(json.dumps(profile_data).encode())
 
         # Export
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(output_dir)],
-        )
+        result = runner.invoke(cli, _export_args(profile_path, output=output_dir))
 
         assert result.exit_code == 0
         assert (output_dir / "Complex Profile.flattened.json").exists()
 
         # Verify data was preserved
         exported = json.loads(
-            (output_dir / "Complex Profile.flattened.json").read_text()
+            (output_dir / "Complex Profile.flattened.json").read_bytes()
         )
         assert exported["temperature"] == ["200"]
         assert len(exported["compatible_printers"]) == 2
 
-    def test_export_default_output_directory(self, tmp_path: Path) -> None:
+    def test_export_default_output_directory(
+        self,
+        runner: CliRunner,
+        profile_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test export with default output directory (current dir)."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
+        # Run from tmp_path so the export doesn't land in the repo
+        monkeypatch.chdir(tmp_path)
 
         # Export without --output (should use current dir)
-        result = runner.invoke(cli, ["export", str(profile_path)])
+        result = runner.invoke(cli, _export_args(profile_path))
 
-        # Should succeed (even if we can't verify output location easily)
         assert result.exit_code == 0
+        assert (tmp_path / "Test.flattened.json").exists()
 
-    def test_export_validates_profile(self, tmp_path: Path) -> None:
+    def test_export_validates_profile(
+        self, runner: CliRunner, tmp_path: Path, output_dir: Path
+    ) -> None:
         """Test export with validation enabled."""
-        runner = CliRunner()
-
         # Create test profile
         profile_path = tmp_path / "test.json"
-        profile_data = {
-            "name": "Test",
-            "type": "filament",
-            "temperature": 200,
-        }
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
+        profile_path.write_bytes(_MINIMAL_WITH_TEMP_BYTES)
 
         # Export with validation
         result = runner.invoke(
             cli,
-            [
-                "export",
-                str(profile_path),
-                "--output",
-                str(output_dir),
-                "--validate",
-            ],
+            _export_args(profile_path, "--validate", output=output_dir),
         )
 
         assert result.exit_code == 0
 
-    def test_export_shows_output_path(self, tmp_path: Path) -> None:
+    def test_export_shows_output_path(
+        self, runner: CliRunner, profile_path: Path, output_dir: Path
+    ) -> None:
         """Test that export command shows output path."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
         # Export
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(output_dir)],
-        )
+        result = runner.invoke(cli, _export_args(profile_path, output=output_dir))
 
         assert result.exit_code == 0
         # Should show the output path
@@ -200,25 +220,22 @@ class TestCLICommandExport:
 class TestCLIHelp:
     """Test CLI help and information."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, runner: CliRunner) -> None:
         """Test main CLI help."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert result.exit_code == 0
         assert "export" in result.output.lower()
 
-    def test_export_help(self) -> None:
+    def test_export_help(self, runner: CliRunner) -> None:
         """Test export command help."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["export", "--help"])
 
         assert result.exit_code == 0
         assert "profile" in result.output.lower()
 
-    def test_cli_version(self) -> None:
+    def test_cli_version(self, runner: CliRunner) -> None:
         """Test CLI version command if present."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
 
         # Version is optional, so just check it doesn't crash
@@ -228,110 +245,63 @@ class TestCLIHelp:
 class TestCLIOptions:
     """Test CLI options and flags."""
 
-    def test_output_flag_short(self, tmp_path: Path) -> None:
+    def test_output_flag_short(self, profile_path: Path, output_dir: Path) -> None:
         """Test short output flag (-o)."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
         # Use short flag
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "-o", str(output_dir)],
+        exit_code = _invoke_quietly(
+            _export_args(profile_path, "-o", os.fspath(output_dir)),
         )
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
-    def test_validate_flag(self, tmp_path: Path) -> None:
+    def test_validate_flag(self, profile_path: Path, output_dir: Path) -> None:
         """Test validate flag."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
         # Use validate flag
-        result = runner.invoke(
-            cli,
-            [
-                "export",
-                str(profile_path),
-                "--output",
-                str(output_dir),
-                "--validate",
-            ],
+        exit_code = _invoke_quietly(
+            _export_args(profile_path, "--validate", output=output_dir),
         )
 
-        assert result.exit_code == 0
+        assert exit_code == 0
 
 
 class TestCLIErrorHandling:
     """Test CLI error handling."""
 
-    def test_invalid_profile_json(self, tmp_path: Path) -> None:
+    def test_invalid_profile_json(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test export with invalid JSON profile."""
-        runner = CliRunner()
-
         # Create invalid JSON file
         profile_path = tmp_path / "invalid.json"
-        profile_path.write_text("{invalid json}")
+        profile_path.write_bytes(b"{invalid json}")
 
-        result = runner.invoke(cli, ["export", str(profile_path)])
+        result = runner.invoke(cli, _export_args(profile_path))
 
         assert result.exit_code != 0
 
-    def test_profile_without_name_field(self, tmp_path: Path) -> None:
+    def test_profile_without_name_field(
+        self, runner: CliRunner, tmp_path: Path, output_dir: Path
+    ) -> None:
         """Test export with profile missing name field."""
-        runner = CliRunner()
-
         # Create profile without name
         profile_path = tmp_path / "no_name.json"
         profile_data = {"type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
+        profile_path.write_bytes(json.dumps(profile_data).encode())
 
         result = runner.invoke(
             cli,
-            [
-                "export",
-                str(profile_path),
-                "--output",
-                str(output_dir),
-                "--validate",
-            ],
+            _export_args(profile_path, "--validate", output=output_dir),
         )
 
         # Should fail validation because name is required
         assert result.exit_code != 0
 
-    def test_invalid_output_directory(self, tmp_path: Path) -> None:
+    def test_invalid_output_directory(
+        self, runner: CliRunner, tmp_path: Path, profile_path: Path
+    ) -> None:
         """Test export with invalid output directory."""
-        runner = CliRunner()
-
-        # Create test profile
-        profile_path = tmp_path / "test.json"
-        profile_data = {"name": "Test", "type": "filament"}
-        profile_path.write_text(json.dumps(profile_data))
-
         # Try to use invalid output directory (parent doesn't exist)
         invalid_output = tmp_path / "nonexistent" / "very" / "nested" / "path"
 
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(invalid_output)],
-        )
+        result = runner.invoke(cli, _export_args(profile_path, output=invalid_output))
 
         # Should succeed because we create directories
         assert result.exit_code == 0
@@ -340,10 +310,10 @@ class TestCLIErrorHandling:
 class TestCLIRealWorldScenarios:
     """Test realistic CLI usage scenarios."""
 
-    def test_export_realistic_filament_profile(self, tmp_path: Path) -> None:
+    def test_export_realistic_filament_profile(
+        self, tmp_path: Path, output_dir: Path
+    ) -> None:
         """Test exporting realistic filament profile."""
-        runner = CliRunner()
-
         # Create realistic profile
         profile_path = tmp_path / "filament.json"
         profile_data = {
@@ -354,48 +324,57 @@ class TestCLIRealWorldScenarios:
             "filament_id": "BBS",
             "compatible_printers": ["Bambu X1C"],
         }
-        profile_path.write_text(json.dumps(profile_data))
+        profile_path.write_bytes(json.dumps(profile_data).encode())
 
-        output_dir = tmp_path / "exports"
-        output_dir.mkdir()
+        exit_code = _invoke_quietly(_export_args(profile_path, output=output_dir))
 
-        result = runner.invoke(
-            cli,
-            ["export", str(profile_path), "--output", str(output_dir)],
-        )
-
-        assert result.exit_code == 0
+        assert exit_code == 0
         # Check that a file was created with the profile name
-        exported_files = list(output_dir.glob("*.flattened.json"))
-        assert len(exported_files) == 1
-        assert "Bambu ABS" in exported_files[0].name
+        with os.scandir(output_dir) as entries:
+            exported_names = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".flattened.json")
+            ]
+        assert len(exported_names) == 1
+        assert "Bambu ABS" in exported_names[0]
 
     def test_batch_export_simulation(self, tmp_path: Path) -> None:
-        """Test exporting multiple profiles sequentially."""
-        runner = CliRunner()
-
+        """Test exporting several profiles into one shared directory."""
         output_dir = tmp_path / "exports"
-        output_dir.mkdir()
-
-        # Export multiple profiles
-        for i in range(3):
-            profile_path = tmp_path / f"profile_{i}.json"
-            profile_data = {
-                "name": f"Profile {i}",
-                "type": "filament",
-            }
-            profile_path.write_text(json.dumps(profile_data))
-
-            result = runner.invoke(
-                cli,
-                ["export", str(profile_path), "--output", str(output_dir)],
-            )
 
-            assert result.exit_code == 0
+        # The last file reuses "Profile 0", so its export replaces the first
+        batch = [
+            ("profile_0.json", {"name": "Profile 0", "type": "filament"}),
+            ("profile_1.json", {"name": "Profile 1", "type": "filament"}),
+            ("profile_2.json", {"name": "Profile 2", "type": "filament"}),
+            (
+                "profile_0_copy.json",
+                {"name": "Profile 0", "type": "filament", "filament_id": "copy"},
+            ),
+        ]
+        for filename, profile_data in batch:
+            profile_path = tmp_path / filename
+            profile_path.write_bytes(json.dumps(profile_data).encode())
+
+            # Call the command body directly since nothing here depends on
+            # click's argument parsing or output
+            export.callback(
+                profile=str(profile_path),
+                output=str(output_dir),
+                output_name=None,
+                validate=False,
+                config_dir=None,
+            )
 
-        # Verify all were exported
-        exported_files = list(output_dir.glob("*.json"))
-        assert len(exported_files) >= 3
+        exported = sorted(path.name for path in output_dir.iterdir())
+        assert exported == [
+            "Profile 0.flattened.json",
+            "Profile 1.flattened.json",
+            "Profile 2.flattened.json",
+        ]
+        replaced = json.loads((output_dir / "Profile 0.flattened.json").read_bytes())
+        assert replaced["filament_id"] == "copy"
 
 
 __all__ = [
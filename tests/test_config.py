@@ -1,7 +1,8 @@
 """Tests for OrcaSlicer configuration module."""
 
+import os
+from itertools import pairwise
 from pathlib import Path
-from typing import Optional
 
 import pytest
 
@@ -11,6 +12,7 @@ from src.config import ProfileLocation
 from src.config import ProfileType
 from src.config import SearchPath
 from src.config import build_search_path
+from src.config import clear_search_cache
 from src.config import create_config
 from src.config import detect_platform
 from src.config import find_profile_path
@@ -18,6 +20,22 @@ from src.config import get_default_orcaslicer_dir
 from src.config import list_profiles
 from src.config import resolve_profile_path
 
+# Absolute path for tests that only construct dataclasses and never touch disk
+_ABS_DIR = Path(os.path.abspath("orca-config-test"))
+
+
+def _make_dirs(*leaves: Path) -> None:
+    """
+    Create directory trees for several leaf directories.
+
+    Leaves are created in sorted order so shared parents are made once.
+
+    Args:
+        *leaves: Leaf directories to create, with any missing parents
+    """
+    for leaf in sorted(leaves):
+        os.makedirs(leaf, exist_ok=True)
+
 
 class TestPlatformDetection:
     """Test platform detection functions."""
@@ -27,25 +45,32 @@ class TestPlatformDetection:
         platform = detect_platform()
         assert isinstance(platform, Platform)
 
-    def test_get_default_dir_macos(self) -> None:
-        """Test default directory path for macOS."""
-        path = get_default_orcaslicer_dir(Platform.MACOS)
-        assert path.name == "OrcaSlicer"
-        assert "Application Support" in str(path)
-        assert path.is_absolute()
-
-    def test_get_default_dir_windows(self) -> None:
-        """Test default directory path for Windows."""
-        path = get_default_orcaslicer_dir(Platform.WINDOWS)
-        assert path.name == "OrcaSlicer"
-        assert "AppData" in str(path) or "Roaming" in str(path)
-        assert path.is_absolute()
-
-    def test_get_default_dir_linux(self) -> None:
-        """Test default directory path for Linux."""
-        path = get_default_orcaslicer_dir(Platform.LINUX)
+    def test_detect_platform_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the platform is probed once until the cache is cleared."""
+        detect_platform.cache_clear()
+        monkeypatch.setattr("sys.platform", "darwin")
+        assert detect_platform() is Platform.MACOS
+
+        monkeypatch.setattr("sys.platform", "win32")
+        assert detect_platform() is Platform.MACOS
+
+        detect_platform.cache_clear()
+        assert detect_platform() is Platform.WINDOWS
+        detect_platform.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("platform", "needle"),
+        [
+            (Platform.MACOS, "Application Support"),
+            (Platform.WINDOWS, "AppData"),
+            (Platform.LINUX, ".config"),
+        ],
+    )
+    def test_get_default_dir(self, platform: Platform, needle: str) -> None:
+        """Test default directory path for each platform."""
+        path = get_default_orcaslicer_dir(platform)
         assert path.name == "OrcaSlicer"
-        assert ".config" in str(path)
+        assert needle in str(path)
         assert path.is_absolute()
 
     def test_get_default_dir_invalid_platform(self) -> None:
@@ -58,14 +83,14 @@ class TestPlatformDetection:
 class TestProfileLocationValidation:
     """Test ProfileLocation dataclass validation."""
 
-    def test_profile_location_absolute_path_valid(self, tmp_path: Path) -> None:
+    def test_profile_location_absolute_path_valid(self) -> None:
         """Test ProfileLocation accepts absolute paths."""
         location = ProfileLocation(
-            path=tmp_path,
+            path=_ABS_DIR,
             priority=10,
             source="test",
         )
-        assert location.path == tmp_path
+        assert location.path == _ABS_DIR
 
     def test_profile_location_relative_path_invalid(self) -> None:
         """Test ProfileLocation rejects relative paths."""
@@ -80,19 +105,19 @@ class TestProfileLocationValidation:
 class TestSearchPathValidation:
     """Test SearchPath dataclass validation."""
 
-    def test_search_path_sorted_by_priority(self, tmp_path: Path) -> None:
+    def test_search_path_sorted_by_priority(self) -> None:
         """Test SearchPath validates that locations are sorted by priority."""
-        loc1 = ProfileLocation(path=tmp_path / "a", priority=10, source="first")
-        loc2 = ProfileLocation(path=tmp_path / "b", priority=20, source="second")
+        loc1 = ProfileLocation(path=_ABS_DIR / "a", priority=10, source="first")
+        loc2 = ProfileLocation(path=_ABS_DIR / "b", priority=20, source="second")
 
         search_path = SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
         assert search_path.locations[0].priority == 10
         assert search_path.locations[1].priority == 20
 
-    def test_search_path_unsorted_raises_error(self, tmp_path: Path) -> None:
+    def test_search_path_unsorted_raises_error(self) -> None:
         """Test SearchPath rejects unsorted locations."""
-        loc1 = ProfileLocation(path=tmp_path / "a", priority=20, source="second")
-        loc2 = ProfileLocation(path=tmp_path / "b", priority=10, source="first")
+        loc1 = ProfileLocation(path=_ABS_DIR / "a", priority=20, source="second")
+        loc2 = ProfileLocation(path=_ABS_DIR / "b", priority=10, source="first")
 
         with pytest.raises(ValueError, match="must be sorted"):
             SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
@@ -101,10 +126,10 @@ class TestSearchPathValidation:
 class TestConfigCreation:
     """Test OrcaSlicerConfig creation."""
 
-    def test_config_with_absolute_base_dir(self, tmp_path: Path) -> None:
+    def test_config_with_absolute_base_dir(self) -> None:
         """Test creating config with absolute base directory."""
-        config = OrcaSlicerConfig(base_dir=tmp_path)
-        assert config.base_dir == tmp_path
+        config = OrcaSlicerConfig(base_dir=_ABS_DIR)
+        assert config.base_dir == _ABS_DIR
         assert config.user_profile == "default"
         assert config.samples_dir is None
 
@@ -113,31 +138,31 @@ class TestConfigCreation:
         with pytest.raises(ValueError, match="must be absolute"):
             OrcaSlicerConfig(base_dir=Path("relative"))
 
-    def test_config_with_relative_samples_dir_raises_error(self, tmp_path: Path) -> None:
+    def test_config_with_relative_samples_dir_raises_error(self) -> None:
         """Test creating config with relative samples_dir raises error."""
         with pytest.raises(ValueError, match="must be absolute"):
             OrcaSlicerConfig(
-                base_dir=tmp_path,
+                base_dir=_ABS_DIR,
                 samples_dir=Path("relative/samples"),
             )
 
-    def test_config_with_custom_user_profile(self, tmp_path: Path) -> None:
+    def test_config_with_custom_user_profile(self) -> None:
         """Test creating config with custom user profile name."""
         config = OrcaSlicerConfig(
-            base_dir=tmp_path,
+            base_dir=_ABS_DIR,
             user_profile="custom_profile",
         )
         assert config.user_profile == "custom_profile"
 
-    def test_config_with_all_parameters(self, tmp_path: Path) -> None:
+    def test_config_with_all_parameters(self) -> None:
         """Test creating config with all parameters specified."""
-        samples = tmp_path / "samples"
+        samples = _ABS_DIR / "samples"
         config = OrcaSlicerConfig(
-            base_dir=tmp_path,
+            base_dir=_ABS_DIR,
             user_profile="my_profile",
             samples_dir=samples,
         )
-        assert config.base_dir == tmp_path
+        assert config.base_dir == _ABS_DIR
         assert config.user_profile == "my_profile"
         assert config.samples_dir == samples
 
@@ -147,18 +172,19 @@ class TestCreateConfigFactory:
 
     def test_create_config_default_macos(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         """Test create_config with auto-detected macOS path."""
-        # Mock the platform detection
-        monkeypatch.setattr("src.config.detect_platform", lambda: Platform.MACOS)
-
         # Create a fake home directory
         fake_home = tmp_path / "home"
         fake_home.mkdir()
         fake_orca_dir = fake_home / "Library" / "Application Support" / "OrcaSlicer"
         fake_orca_dir.mkdir(parents=True)
 
-        monkeypatch.setattr("pathlib.Path.home", lambda: fake_home)
+        # Mock platform detection and the home directory only around the call
+        with monkeypatch.context() as m:
+            m.setattr("src.config.detect_platform", lambda: Platform.MACOS)
+            m.setattr("src.config._home_dir", lambda: fake_home)
+            config = create_config()
 
-        config = create_config()
+        assert config.base_dir == fake_orca_dir
         assert config.user_profile == "default"
         assert config.samples_dir is None
 
@@ -214,10 +240,8 @@ class TestBuildSearchPath:
     def test_build_search_path_user_and_system(self, tmp_path: Path) -> None:
         """Test search path with user and system directories."""
         user_dir = tmp_path / "user" / "default" / "filament"
-        user_dir.mkdir(parents=True)
-
         system_vendor_dir = tmp_path / "system" / "Creality" / "filament"
-        system_vendor_dir.mkdir(parents=True)
+        _make_dirs(user_dir, system_vendor_dir)
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         search_path = build_search_path(config, ProfileType.FILAMENT)
@@ -229,13 +253,9 @@ class TestBuildSearchPath:
     def test_build_search_path_multiple_vendors(self, tmp_path: Path) -> None:
         """Test search path with multiple vendor directories."""
         user_dir = tmp_path / "user" / "default" / "filament"
-        user_dir.mkdir(parents=True)
-
         creality_dir = tmp_path / "system" / "Creality" / "filament"
-        creality_dir.mkdir(parents=True)
-
         qidi_dir = tmp_path / "system" / "Qidi" / "filament"
-        qidi_dir.mkdir(parents=True)
+        _make_dirs(user_dir, creality_dir, qidi_dir)
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         search_path = build_search_path(config, ProfileType.FILAMENT)
@@ -246,139 +266,137 @@ class TestBuildSearchPath:
     def test_build_search_path_with_samples(self, tmp_path: Path) -> None:
         """Test search path including samples directory."""
         user_dir = tmp_path / "user" / "default" / "filament"
-        user_dir.mkdir(parents=True)
-
         samples_vendor_dir = tmp_path / "samples" / "profiles" / "BBL" / "filament"
-        samples_vendor_dir.mkdir(parents=True)
+        _make_dirs(user_dir, samples_vendor_dir)
 
         config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=tmp_path / "samples")
         search_path = build_search_path(config, ProfileType.FILAMENT)
 
         # Should have user (10) and samples (30) at minimum
-        priorities = [loc.priority for loc in search_path.locations]
-        assert 10 in priorities
-        assert 30 in priorities
+        priorities = {loc.priority for loc in search_path.locations}
+        assert {10, 30} <= priorities
 
     def test_build_search_path_sorted_by_priority(self, tmp_path: Path) -> None:
         """Test that search path locations are sorted by priority."""
         # Create all three levels
         user_dir = tmp_path / "user" / "default" / "machine"
-        user_dir.mkdir(parents=True)
-
         system_dir = tmp_path / "system" / "BBL" / "machine"
-        system_dir.mkdir(parents=True)
-
         samples_dir = tmp_path / "samples" / "profiles" / "Prusa" / "machine"
-        samples_dir.mkdir(parents=True)
+        _make_dirs(user_dir, system_dir, samples_dir)
 
         config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=tmp_path / "samples")
         search_path = build_search_path(config, ProfileType.MACHINE)
 
         # Verify priorities are in order
-        for i in range(len(search_path.locations) - 1):
-            assert search_path.locations[i].priority <= search_path.locations[i + 1].priority
+        assert all(a.priority <= b.priority for a, b in pairwise(search_path.locations))
 
-    def test_build_search_path_different_profile_types(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("profile_type", list(ProfileType))
+    def test_build_search_path_different_profile_types(
+        self, tmp_path: Path, profile_type: ProfileType
+    ) -> None:
         """Test search path with different profile types."""
-        user_dir_filament = tmp_path / "user" / "default" / "filament"
-        user_dir_filament.mkdir(parents=True)
+        user_dirs = {
+            other: tmp_path / "user" / "default" / other.value for other in ProfileType
+        }
+        _make_dirs(*user_dirs.values())
 
-        user_dir_machine = tmp_path / "user" / "default" / "machine"
-        user_dir_machine.mkdir(parents=True)
+        config = OrcaSlicerConfig(base_dir=tmp_path)
+        search_path = build_search_path(config, profile_type)
 
-        user_dir_process = tmp_path / "user" / "default" / "process"
-        user_dir_process.mkdir(parents=True)
+        assert search_path.locations[0].path == user_dirs[profile_type]
+
+    def test_build_search_path_cached(self, tmp_path: Path) -> None:
+        """Test repeated lookups reuse the cached search path."""
+        (tmp_path / "user" / "default" / "filament").mkdir(parents=True)
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
+        first = build_search_path(config, ProfileType.FILAMENT)
+        second = build_search_path(
+            OrcaSlicerConfig(base_dir=tmp_path), ProfileType.FILAMENT
+        )
 
-        filament_path = build_search_path(config, ProfileType.FILAMENT)
-        machine_path = build_search_path(config, ProfileType.MACHINE)
-        process_path = build_search_path(config, ProfileType.PROCESS)
+        assert second is first
 
-        assert filament_path.locations[0].path == user_dir_filament
-        assert machine_path.locations[0].path == user_dir_machine
-        assert process_path.locations[0].path == user_dir_process
+    def test_clear_search_cache_rescans(self, tmp_path: Path) -> None:
+        """Test clear_search_cache picks up newly created directories."""
+        config = OrcaSlicerConfig(base_dir=tmp_path)
+        assert build_search_path(config, ProfileType.FILAMENT).locations == ()
+
+        (tmp_path / "system" / "Creality" / "filament").mkdir(parents=True)
+        assert build_search_path(config, ProfileType.FILAMENT).locations == ()
+
+        clear_search_cache()
+        search_path = build_search_path(config, ProfileType.FILAMENT)
+        assert len(search_path.locations) == 1
+        assert search_path.locations[0].source == "system/Creality"
+
+
+@pytest.fixture(scope="class")
+def find_locations(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[SearchPath, Path, Path]:
+    """
+    Build two search locations shared by the find_profile_path tests.
+
+    dir1 holds first.json and both.json, dir2 holds second.json and
+    both.json, and dir1/folder.json is a directory. Tests only read
+    the tree, so it is built once per class.
+    """
+    root = tmp_path_factory.mktemp("find_profile_path")
+    dir1 = root / "dir1"
+    dir2 = root / "dir2"
+    _make_dirs(dir1 / "folder.json", dir2)
+    for path in (
+        dir1 / "first.json",
+        dir1 / "both.json",
+        dir2 / "second.json",
+        dir2 / "both.json",
+    ):
+        path.touch()
+
+    loc1 = ProfileLocation(path=dir1, priority=10, source="first")
+    loc2 = ProfileLocation(path=dir2, priority=20, source="second")
+    search_path = SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
+    return search_path, dir1, dir2
 
 
 class TestFindProfilePath:
     """Test find_profile_path function."""
 
-    def test_find_profile_path_first_location(self, tmp_path: Path) -> None:
+    def test_find_profile_path_first_location(
+        self, find_locations: tuple[SearchPath, Path, Path]
+    ) -> None:
         """Test finding profile in first location."""
-        dir1 = tmp_path / "dir1"
-        dir1.mkdir()
-        profile1 = dir1 / "test.json"
-        profile1.write_text("{}")
-
-        dir2 = tmp_path / "dir2"
-        dir2.mkdir()
-
-        loc1 = ProfileLocation(path=dir1, priority=10, source="first")
-        loc2 = ProfileLocation(path=dir2, priority=20, source="second")
-        search_path = SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
+        search_path, dir1, _ = find_locations
+        assert find_profile_path("first.json", search_path) == dir1 / "first.json"
 
-        result = find_profile_path("test.json", search_path)
-        assert result == profile1
-
-    def test_find_profile_path_second_location(self, tmp_path: Path) -> None:
+    def test_find_profile_path_second_location(
+        self, find_locations: tuple[SearchPath, Path, Path]
+    ) -> None:
         """Test finding profile in second location when not in first."""
-        dir1 = tmp_path / "dir1"
-        dir1.mkdir()
-
-        dir2 = tmp_path / "dir2"
-        dir2.mkdir()
-        profile2 = dir2 / "test.json"
-        profile2.write_text("{}")
-
-        loc1 = ProfileLocation(path=dir1, priority=10, source="first")
-        loc2 = ProfileLocation(path=dir2, priority=20, source="second")
-        search_path = SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
-
-        result = find_profile_path("test.json", search_path)
-        assert result == profile2
+        search_path, _, dir2 = find_locations
+        assert find_profile_path("second.json", search_path) == dir2 / "second.json"
 
-    def test_find_profile_path_priority_order(self, tmp_path: Path) -> None:
+    def test_find_profile_path_priority_order(
+        self, find_locations: tuple[SearchPath, Path, Path]
+    ) -> None:
         """Test that find returns first match by priority."""
-        dir1 = tmp_path / "dir1"
-        dir1.mkdir()
-        profile1 = dir1 / "test.json"
-        profile1.write_text("{}")
-
-        dir2 = tmp_path / "dir2"
-        dir2.mkdir()
-        profile2 = dir2 / "test.json"
-        profile2.write_text("{}")
-
-        loc1 = ProfileLocation(path=dir1, priority=10, source="first")
-        loc2 = ProfileLocation(path=dir2, priority=20, source="second")
-        search_path = SearchPath(locations=(loc1, loc2), profile_type=ProfileType.FILAMENT)
-
-        result = find_profile_path("test.json", search_path)
-        assert result == profile1
+        search_path, dir1, _ = find_locations
+        assert find_profile_path("both.json", search_path) == dir1 / "both.json"
 
-    def test_find_profile_path_not_found(self, tmp_path: Path) -> None:
+    def test_find_profile_path_not_found(
+        self, find_locations: tuple[SearchPath, Path, Path]
+    ) -> None:
         """Test finding non-existent profile returns None."""
-        dir1 = tmp_path / "dir1"
-        dir1.mkdir()
-
-        loc1 = ProfileLocation(path=dir1, priority=10, source="first")
-        search_path = SearchPath(locations=(loc1,), profile_type=ProfileType.FILAMENT)
+        search_path, _, _ = find_locations
+        assert find_profile_path("nonexistent.json", search_path) is None
 
-        result = find_profile_path("nonexistent.json", search_path)
-        assert result is None
-
-    def test_find_profile_path_ignores_directories(self, tmp_path: Path) -> None:
+    def test_find_profile_path_ignores_directories(
+        self, find_locations: tuple[SearchPath, Path, Path]
+    ) -> None:
         """Test that find_profile_path ignores directories."""
-        dir1 = tmp_path / "dir1"
-        dir1.mkdir()
-        subdir = dir1 / "test.json"
-        subdir.mkdir()
-
-        loc1 = ProfileLocation(path=dir1, priority=10, source="first")
-        search_path = SearchPath(locations=(loc1,), profile_type=ProfileType.FILAMENT)
-
-        result = find_profile_path("test.json", search_path)
-        assert result is None
+        search_path, _, _ = find_locations
+        assert find_profile_path("folder.json", search_path) is None
 
 
 class TestResolveProfilePath:
@@ -387,7 +405,7 @@ class TestResolveProfilePath:
     def test_resolve_absolute_path_existing(self, tmp_path: Path) -> None:
         """Test resolving an absolute path that exists."""
         profile = tmp_path / "test.json"
-        profile.write_text("{}")
+        profile.touch()
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         result = resolve_profile_path(str(profile), config, ProfileType.FILAMENT)
@@ -413,7 +431,7 @@ class TestResolveProfilePath:
         user_dir = tmp_path / "user" / "default" / "filament"
         user_dir.mkdir(parents=True)
         profile = user_dir / "test.json"
-        profile.write_text("{}")
+        profile.touch()
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         result = resolve_profile_path("test.json", config, ProfileType.FILAMENT)
@@ -422,12 +440,11 @@ class TestResolveProfilePath:
     def test_resolve_filename_user_overrides_system(self, tmp_path: Path) -> None:
         """Test that user profile overrides system profile."""
         user_dir = tmp_path / "user" / "default" / "filament"
-        user_dir.mkdir(parents=True)
+        system_dir = tmp_path / "system" / "Creality" / "filament"
+        _make_dirs(user_dir, system_dir)
+
         user_profile = user_dir / "test.json"
         user_profile.write_text('{"name": "user"}')
-
-        system_dir = tmp_path / "system" / "Creality" / "filament"
-        system_dir.mkdir(parents=True)
         system_profile = system_dir / "test.json"
         system_profile.write_text('{"name": "system"}')
 
@@ -438,12 +455,11 @@ class TestResolveProfilePath:
     def test_resolve_filename_system_overrides_samples(self, tmp_path: Path) -> None:
         """Test that system profile overrides samples."""
         system_dir = tmp_path / "system" / "Creality" / "filament"
-        system_dir.mkdir(parents=True)
+        samples_dir = tmp_path / "samples" / "profiles" / "BBL" / "filament"
+        _make_dirs(system_dir, samples_dir)
+
         system_profile = system_dir / "test.json"
         system_profile.write_text('{"name": "system"}')
-
-        samples_dir = tmp_path / "samples" / "profiles" / "BBL" / "filament"
-        samples_dir.mkdir(parents=True)
         samples_profile = samples_dir / "test.json"
         samples_profile.write_text('{"name": "samples"}')
 
@@ -472,6 +488,27 @@ class TestResolveProfilePath:
         with pytest.raises(ValueError, match="Relative paths not supported"):
             resolve_profile_path("path/to/profile.json", config, ProfileType.FILAMENT)
 
+    def test_resolve_filename_cached_until_cleared(self, tmp_path: Path) -> None:
+        """Test resolved paths are cached until clear_search_cache is called."""
+        user_dir = tmp_path / "user" / "default" / "filament"
+        user_dir.mkdir(parents=True)
+        profile = user_dir / "test.json"
+        profile.touch()
+
+        config = OrcaSlicerConfig(base_dir=tmp_path)
+        assert (
+            resolve_profile_path("test.json", config, ProfileType.FILAMENT) == profile
+        )
+
+        profile.unlink()
+        assert (
+            resolve_profile_path("test.json", config, ProfileType.FILAMENT) == profile
+        )
+
+        clear_search_cache()
+        with pytest.raises(FileNotFoundError):
+            resolve_profile_path("test.json", config, ProfileType.FILAMENT)
+
 
 class TestListProfiles:
     """Test list_profiles function."""
@@ -486,14 +523,29 @@ class TestListProfiles:
 
         assert result == {}
 
+    def test_list_profiles_skips_plain_file_locations(self, tmp_path: Path) -> None:
+        """Test that profile type paths which are plain files are ignored."""
+        user_file = tmp_path / "user" / "default" / "filament"
+        vendor_file = tmp_path / "system" / "Acme" / "filament"
+        _make_dirs(user_file.parent, vendor_file.parent)
+        user_file.touch()
+        vendor_file.touch()
+
+        config = OrcaSlicerConfig(base_dir=tmp_path)
+        search_path = build_search_path(config, ProfileType.FILAMENT)
+        result = list_profiles(config, ProfileType.FILAMENT)
+
+        assert [loc.source for loc in search_path.locations] == ["user/default"]
+        assert result == {}
+
     def test_list_profiles_from_user_directory(self, tmp_path: Path) -> None:
         """Test listing profiles from user directory."""
         user_dir = tmp_path / "user" / "default" / "filament"
         user_dir.mkdir(parents=True)
         profile1 = user_dir / "profile1.json"
-        profile1.write_text("{}")
+        profile1.touch()
         profile2 = user_dir / "profile2.json"
-        profile2.write_text("{}")
+        profile2.touch()
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         result = list_profiles(config, ProfileType.FILAMENT)
@@ -504,14 +556,13 @@ class TestListProfiles:
     def test_list_profiles_multiple_sources(self, tmp_path: Path) -> None:
         """Test listing profiles from multiple sources."""
         user_dir = tmp_path / "user" / "default" / "filament"
-        user_dir.mkdir(parents=True)
-        user_profile = user_dir / "user.json"
-        user_profile.write_text("{}")
-
         system_dir = tmp_path / "system" / "Creality" / "filament"
-        system_dir.mkdir(parents=True)
+        _make_dirs(user_dir, system_dir)
+
+        user_profile = user_dir / "user.json"
+        user_profile.touch()
         system_profile = system_dir / "system.json"
-        system_profile.write_text("{}")
+        system_profile.touch()
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         result = list_profiles(config, ProfileType.FILAMENT)
@@ -525,11 +576,11 @@ class TestListProfiles:
         user_dir = tmp_path / "user" / "default" / "filament"
         user_dir.mkdir(parents=True)
         profile_b = user_dir / "b.json"
-        profile_b.write_text("{}")
+        profile_b.touch()
         profile_a = user_dir / "a.json"
-        profile_a.write_text("{}")
+        profile_a.touch()
         profile_c = user_dir / "c.json"
-        profile_c.write_text("{}")
+        profile_c.touch()
 
         config = OrcaSlicerConfig(base_dir=tmp_path)
         result = list_profiles(config, ProfileType.FILAMENT)
@@ -542,7 +593,7 @@ class TestListProfiles:
         user_dir = tmp_path / "user" / "default" / "filament"
         user_dir.mkdir(parents=True)
         profile_json = user_dir / "profile.json"
-        profile_json.write_text("{}")
+        profile_json.touch()
         profile_txt = user_dir / "readme.txt"
         profile_txt.write_text("text")
 
@@ -552,16 +603,18 @@ class TestListProfiles:
         assert len(result["user/default"]) == 1
         assert result["user/default"][0].name == "profile.json"
 
-    def test_list_profiles_all_types(self, tmp_path: Path) -> None:
-        """Test listing all profile types."""
-        for profile_type in [ProfileType.FILAMENT, ProfileType.MACHINE, ProfileType.PROCESS]:
-            profile_dir = tmp_path / "user" / "default" / profile_type.value
-            profile_dir.mkdir(parents=True)
-            profile = profile_dir / "test.json"
-            profile.write_text("{}")
+    @pytest.mark.parametrize("profile_type", list(ProfileType))
+    def test_list_profiles_all_types(
+        self, tmp_path: Path, profile_type: ProfileType
+    ) -> None:
+        """Test listing each profile type."""
+        profile_dir = tmp_path / "user" / "default" / profile_type.value
+        profile_dir.mkdir(parents=True)
+        profile = profile_dir / "test.json"
+        profile.touch()
 
-            config = OrcaSlicerConfig(base_dir=tmp_path)
-            result = list_profiles(config, profile_type)
+        config = OrcaSlicerConfig(base_dir=tmp_path)
+        result = list_profiles(config, profile_type)
 
-            assert "user/default" in result
-            assert len(result["user/default"]) == 1
+        assert "user/default" in result
+        assert len(result["user/default"]) == 1
@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -63,6 +64,16 @@ class TestGenerateFilename:
         assert "flattened.json" in filename
         assert "Test" in filename
 
+    def test_generate_filename_is_sanitized(self, tmp_path: Path) -> None:
+        """Test generated filenames are already sanitized."""
+        exporter = ProfileExporter(output_dir=tmp_path)
+        profile = {"name": "../Test / Profile (v1)"}
+
+        filename = exporter._generate_filename(profile)
+
+        assert filename == "Test Profile v1.flattened.json"
+        assert exporter._sanitize_filename(filename) == filename
+
     def test_generate_filename_custom_suffix(self, tmp_path: Path) -> None:
         """Test generating filename with custom suffix."""
         exporter = ProfileExporter(output_dir=tmp_path)
@@ -220,6 +231,36 @@ class TestExportProfile:
         assert "\n" in content
         assert "  " in content or "\t" in content
 
+    def test_export_rejects_overwriting_source(self, tmp_path: Path) -> None:
+        """Test exporting onto the source file raises ExportError."""
+        source = tmp_path / "source.json"
+        source.write_text("{}", encoding="utf-8")
+        exporter = ProfileExporter(output_dir=tmp_path)
+
+        with pytest.raises(ExportError, match="Cannot overwrite source"):
+            exporter.export_profile(
+                {"name": "Test"}, filename="source.json", source_path=source
+            )
+
+    def test_export_rejects_overwriting_source_via_symlink(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a symlinked output directory still detects the source file."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        source = real_dir / "source.json"
+        source.write_text("{}", encoding="utf-8")
+        link_dir = tmp_path / "link"
+        link_dir.symlink_to(real_dir)
+        exporter = ProfileExporter(output_dir=link_dir)
+
+        with pytest.raises(ExportError, match="Cannot overwrite source"):
+            exporter.export_profile(
+                {"name": "Test"}, filename="source.json", source_path=source
+            )
+
+        assert source.read_text(encoding="utf-8") == "{}"
+
 
 class TestExportMultipleProfiles:
     """Test exporting multiple profiles."""
@@ -254,6 +295,54 @@ class TestExportMultipleProfiles:
         assert len(output_paths) == 5
         assert all(path.exists() for path in output_paths)
 
+    def test_export_profiles_preserves_order(self, tmp_path: Path) -> None:
+        """Test batch export returns paths in input order."""
+        exporter = ProfileExporter(output_dir=tmp_path / "nested" / "out")
+        profiles = [
+            {"name": f"Profile {i}", "type": "filament"} for i in range(20)
+        ]
+
+        output_paths = exporter.export_profiles(profiles)
+
+        assert [path.name for path in output_paths] == [
+            f"Profile {i}.flattened.json" for i in range(20)
+        ]
+
+    def test_export_profiles_same_name_last_wins(self, tmp_path: Path) -> None:
+        """Test same-named profiles leave the last profile's valid JSON."""
+        exporter = ProfileExporter(output_dir=tmp_path)
+        profiles = [
+            {"name": "Same", "type": "filament", "notes": "x" * (i * 1000)}
+            for i in range(16)
+        ]
+
+        output_paths = exporter.export_profiles(profiles)
+
+        assert output_paths == [tmp_path / "Same.flattened.json"] * 16
+        exported = json.loads(output_paths[0].read_text(encoding="utf-8"))
+        assert exported["notes"] == "x" * 15000
+
+    def test_export_profiles_creates_dir_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batch export creates the output directory only once."""
+        exporter = ProfileExporter(output_dir=tmp_path / "out")
+        calls = []
+        original_mkdir = Path.mkdir
+
+        def counting_mkdir(self: Path, *args: Any, **kwargs: Any) -> None:
+            calls.append(self)
+            original_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        profiles = [
+            {"name": f"Profile {i}", "type": "filament"} for i in range(5)
+        ]
+
+        exporter.export_profiles(profiles)
+
+        assert calls == [tmp_path / "out"]
+
     def test_export_profiles_with_custom_names(
         self, tmp_path: Path
     ) -> None:
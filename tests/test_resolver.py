@@ -1,6 +1,7 @@
 """Tests for OrcaSlicer profile inheritance resolver module."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -13,6 +14,7 @@ from src.resolver import InvalidProfileError
 from src.resolver import ProfileNotFoundError
 from src.resolver import ProfileResolver
 from src.resolver import ProfileResolverError
+from src.resolver import _read_profile_name
 
 
 class TestProfileResolverExceptions:
@@ -155,6 +157,35 @@ class TestProfileResolverMergeProfiles:
         assert parent == parent_orig
 
 
+class TestReadProfileName:
+    """Test _read_profile_name() helper."""
+
+    def test_read_name_decodes_escapes(self, tmp_path: Path) -> None:
+        """Test escaped characters in the name are decoded."""
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"name": 'Quote " and \u00e9'}))
+
+        assert _read_profile_name(path) == 'Quote " and \u00e9'
+
+    def test_read_name_beyond_scanned_head(self, tmp_path: Path) -> None:
+        """Test a name after the scanned head falls back to a full parse."""
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"padding": "x" * 20000, "name": "Late"}))
+
+        assert _read_profile_name(path) == "Late"
+
+    def test_read_name_missing_or_invalid(self, tmp_path: Path) -> None:
+        """Test files without a readable name return None."""
+        no_name = tmp_path / "no_name.json"
+        no_name.write_text(json.dumps({"type": "filament"}))
+        invalid = tmp_path / "invalid.json"
+        invalid.write_text("{not json")
+
+        assert _read_profile_name(no_name) is None
+        assert _read_profile_name(invalid) is None
+        assert _read_profile_name(tmp_path / "missing.json") is None
+
+
 class TestProfileResolverFindParentProfile:
     """Test ProfileResolver._find_parent_profile() method."""
 
@@ -201,6 +232,34 @@ class TestProfileResolverFindParentProfile:
 
         assert found == profile_path
 
+    def test_find_parent_by_name_builds_index_once(self, tmp_path: Path) -> None:
+        """Test name lookups in one location share a single index."""
+        samples_base = tmp_path / "samples"
+        filament_dir = samples_base / "profiles" / "TestVendor" / "filament"
+        filament_dir.mkdir(parents=True)
+        first = filament_dir / "first.json"
+        first.write_text(json.dumps({"name": "First Name"}))
+        second = filament_dir / "second.json"
+        second.write_text(json.dumps({"name": "Second Name"}))
+
+        config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=samples_base)
+        resolver = ProfileResolver(config)
+
+        assert (
+            resolver._find_parent_profile("First Name", ProfileType.FILAMENT) == first
+        )
+        assert (
+            resolver._find_parent_profile("Second Name", ProfileType.FILAMENT)
+            == second
+        )
+        assert resolver._name_index == {
+            filament_dir: {"First Name": first, "Second Name": second}
+        }
+
+        resolver.clear_cache()
+
+        assert resolver._name_index == {}
+
 
 class TestProfileResolverResolveInheritanceChain:
     """Test ProfileResolver._resolve_inheritance_chain() method."""
@@ -258,6 +317,27 @@ class TestProfileResolverResolveInheritanceChain:
         with pytest.raises(CircularInheritanceError):
             resolver._resolve_inheritance_chain(profile, ProfileType.FILAMENT)
 
+    def test_resolve_circular_inheritance_reports_chain(
+        self, tmp_path: Path
+    ) -> None:
+        """Test the circular inheritance error lists the chain in order."""
+        samples_base = tmp_path / "samples"
+        samples_dir = samples_base / "profiles" / "TestVendor" / "filament"
+        samples_dir.mkdir(parents=True)
+        (samples_dir / "a.json").write_text(
+            json.dumps({"name": "A", "inherits": "b.json"})
+        )
+        (samples_dir / "b.json").write_text(
+            json.dumps({"name": "B", "inherits": "a.json"})
+        )
+
+        config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=samples_base)
+        resolver = ProfileResolver(config)
+        profile = {"name": "A", "type": "filament", "inherits": "b.json"}
+
+        with pytest.raises(CircularInheritanceError, match="A -> B -> A"):
+            resolver._resolve_inheritance_chain(profile, ProfileType.FILAMENT)
+
     def test_resolve_multi_level_inheritance(self, tmp_path: Path) -> None:
         """Test resolving 3-level inheritance chain."""
         samples_base = tmp_path / "samples"
@@ -417,6 +497,80 @@ class TestProfileResolverCaching:
         resolved = resolver.resolve_profile(profile_path)
 
         assert resolved["name"] == "Test"
+        assert str(profile_path.resolve()) in resolver._cache
+
+    def test_config_change_clears_parent_lookups(self, tmp_path: Path) -> None:
+        """Test replacing the config drops cached parent lookups."""
+        first_base = tmp_path / "first"
+        first_dir = first_base / "profiles" / "VendorA" / "filament"
+        first_dir.mkdir(parents=True)
+        (first_dir / "parent.json").write_text(json.dumps({"name": "Parent"}))
+        second_base = tmp_path / "second"
+        second_dir = second_base / "profiles" / "VendorB" / "filament"
+        second_dir.mkdir(parents=True)
+        (second_dir / "parent.json").write_text(json.dumps({"name": "Parent"}))
+
+        resolver = ProfileResolver(
+            OrcaSlicerConfig(base_dir=tmp_path, samples_dir=first_base)
+        )
+        assert (
+            resolver._find_parent_profile("parent", ProfileType.FILAMENT)
+            == first_dir / "parent.json"
+        )
+
+        resolver.config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=second_base)
+
+        assert (
+            resolver._find_parent_profile("parent", ProfileType.FILAMENT)
+            == second_dir / "parent.json"
+        )
+
+    def test_cache_reused_across_resolves(self, tmp_path: Path) -> None:
+        """Test that a second resolve reuses cached profiles and parents."""
+        samples_base = tmp_path / "samples"
+        samples_dir = samples_base / "profiles" / "TestVendor" / "filament"
+        samples_dir.mkdir(parents=True)
+        parent = samples_dir / "parent.json"
+        parent.write_text(json.dumps({"name": "Parent", "temp": 200}))
+
+        profile_path = tmp_path / "child.json"
+        profile_path.write_text(
+            json.dumps({"name": "Child", "type": "filament", "inherits": "parent"})
+        )
+
+        config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=samples_base)
+        resolver = ProfileResolver(config)
+        resolver.resolve_profile(profile_path)
+
+        # Unchanged files are served from the cache
+        cached = resolver._cache[str(parent.resolve())]
+        resolver.resolve_profile(profile_path)
+        assert resolver._cache[str(parent.resolve())] is cached
+
+    def test_cache_reloads_edited_profiles(self, tmp_path: Path) -> None:
+        """Test that a profile edited on disk is reloaded on the next resolve."""
+        samples_base = tmp_path / "samples"
+        samples_dir = samples_base / "profiles" / "TestVendor" / "filament"
+        samples_dir.mkdir(parents=True)
+        parent = samples_dir / "parent.json"
+        parent.write_text(json.dumps({"name": "Parent", "temp": 200}))
+
+        profile_path = tmp_path / "child.json"
+        profile_path.write_text(
+            json.dumps({"name": "Child", "type": "filament", "inherits": "parent"})
+        )
+
+        config = OrcaSlicerConfig(base_dir=tmp_path, samples_dir=samples_base)
+        resolver = ProfileResolver(config)
+        assert resolver.resolve_profile(profile_path)["temp"] == 200
+
+        parent.write_text(json.dumps({"name": "Parent", "temp": 210}))
+        # Move the mtime forward explicitly in case the filesystem's
+        # timestamps are too coarse to tell the two writes apart
+        mtime = parent.stat().st_mtime_ns + 1_000_000_000
+        os.utime(parent, ns=(mtime, mtime))
+
+        assert resolver.resolve_profile(profile_path)["temp"] == 210
 
     def test_profile_type_detection(self, tmp_path: Path) -> None:
         """Test auto-detecting profile type from JSON."""
@@ -1,14 +1,21 @@
 """Tests for OrcaSlicer profile validation module."""
 
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+import src.validator as validator_module
 from src.validator import CONFLICT_KEYS
 from src.validator import OBSOLETE_KEYS
 from src.validator import ProfileValidator
 from src.validator import ValidationIssue
 from src.validator import ValidationResult
+from src.validator import _find_json_files
+from src.validator import load_json_with_duplicate_check
 
 
 class TestValidationIssue:
@@ -35,6 +42,21 @@ class TestValidationIssue:
         )
         assert issue.file_path == file_path
 
+    def test_validation_issue_is_immutable(self) -> None:
+        """Test ValidationIssue fields can't be reassigned."""
+        issue = ValidationIssue(level="error", message="Test error")
+
+        with pytest.raises(AttributeError):
+            issue.message = "Changed"  # type: ignore[misc]
+
+    def test_validation_issue_pickles(self, tmp_path: Path) -> None:
+        """Test issues survive pickling, as done by worker processes."""
+        issue = ValidationIssue(
+            level="warning", message="Test warning", file_path=tmp_path
+        )
+
+        assert pickle.loads(pickle.dumps(issue)) == issue
+
 
 class TestValidationResult:
     """Test ValidationResult dataclass and methods."""
@@ -125,6 +147,119 @@ class TestValidationResult:
         assert merged.error_count == 1
         assert merged.warning_count == 1
 
+    def test_counts_follow_appended_issues(self) -> None:
+        """Test counts include issues appended after an earlier read."""
+        result = ValidationResult()
+        result.issues.append(ValidationIssue(level="error", message="E1"))
+        assert result.error_count == 1
+        assert result.warning_count == 0
+
+        result.issues.append(ValidationIssue(level="warning", message="W1"))
+        result.issues.append(ValidationIssue(level="error", message="E2"))
+
+        assert result.error_count == 2
+        assert result.warning_count == 1
+
+    def test_counts_follow_replaced_issue_list(self) -> None:
+        """Test counts are recomputed when the issue list is replaced."""
+        result = ValidationResult(
+            issues=[ValidationIssue(level="error", message="E1")]
+        )
+        assert result.has_errors
+
+        result.issues = [ValidationIssue(level="warning", message="W1")]
+
+        assert not result.has_errors
+        assert result.warning_count == 1
+
+    def test_counts_follow_in_place_edits(self) -> None:
+        """Test counts follow edits that keep the issue list's length."""
+        result = ValidationResult(
+            issues=[ValidationIssue(level="error", message="E1")]
+        )
+        assert result.error_count == 1
+
+        result.issues[0] = ValidationIssue(level="warning", message="W1")
+        assert result.error_count == 0
+        assert result.warning_count == 1
+
+        result.issues.clear()
+        result.issues.extend([ValidationIssue(level="error", message="E2")])
+        assert result.has_errors
+        assert result.warning_count == 0
+
+    def test_extend_results(self) -> None:
+        """Test extending a result in place."""
+        result = ValidationResult(
+            issues=[ValidationIssue(level="error", message="Error")],
+            files_checked=1,
+        )
+        other = ValidationResult(
+            issues=[ValidationIssue(level="warning", message="Warning")],
+            files_checked=2,
+        )
+
+        result.extend(other)
+
+        assert [i.message for i in result.issues] == ["Error", "Warning"]
+        assert result.files_checked == 3
+        assert other.files_checked == 2
+        assert len(other.issues) == 1
+
+
+class TestFindJsonFiles:
+    """Test _find_json_files() helper."""
+
+    def test_matches_rglob(self, tmp_path: Path) -> None:
+        """Test the same files are found as rglob, in sorted order."""
+        for relative in (
+            "a.json",
+            "notes.txt",
+            "sub1/b.json",
+            "sub1/deep/c.json",
+            "sub2/d.json",
+            "sub2/deeper/nested/e.json",
+        ):
+            path = tmp_path / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("{}")
+
+        assert _find_json_files(tmp_path) == sorted(tmp_path.rglob("*.json"))
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test a missing directory yields no files."""
+        assert _find_json_files(tmp_path / "missing") == []
+
+
+class TestLoadJsonWithDuplicateCheck:
+    """Test load_json_with_duplicate_check() function."""
+
+    def test_loads_nested_objects(self, tmp_path: Path) -> None:
+        """Test files without duplicate keys load normally."""
+        path = tmp_path / "profile.json"
+        path.write_text('{"name": "Test", "nested": {"a": 1, "b": [1, 2]}}')
+
+        assert load_json_with_duplicate_check(path) == {
+            "name": "Test",
+            "nested": {"a": 1, "b": [1, 2]},
+        }
+
+    def test_duplicate_key_reported(self, tmp_path: Path) -> None:
+        """Test the first repeated key is named in the error."""
+        path = tmp_path / "profile.json"
+        path.write_text('{"a": 1, "b": {"c": 1, "c": 2}, "a": 3}')
+
+        with pytest.raises(ValueError, match="Duplicate key detected: c"):
+            load_json_with_duplicate_check(path)
+
+    def test_bom_rejected(self, tmp_path: Path) -> None:
+        """Test a UTF-8 BOM is rejected like json.loads does."""
+        path = tmp_path / "profile.json"
+        path.write_bytes(b'\xef\xbb\xbf{"name": "Test"}')
+
+        with pytest.raises(ValueError, match="BOM"):
+            load_json_with_duplicate_check(path)
+
 
 class TestProfileValidator:
     """Test ProfileValidator class."""
@@ -153,6 +288,85 @@ class TestProfileValidator:
 
         assert validator.conflict_keys == custom_conflicts
 
+    def test_validator_custom_loads(self, tmp_path: Path) -> None:
+        """Test validator parses profiles with the provided JSON decoder."""
+        filament_dir = tmp_path / "TestVendor" / "filament"
+        filament_dir.mkdir(parents=True)
+        (filament_dir / "test_profile.json").write_text('{"name": "Test"}')
+
+        decoded: list[bytes] = []
+
+        def loads(data: bytes) -> dict:
+            decoded.append(data)
+            return {"name": "Test", "acceleration": 1000}
+
+        validator = ProfileValidator(profiles_dir=tmp_path, loads=loads)
+        result = validator.validate_obsolete_keys("TestVendor")
+
+        assert decoded == [b'{"name": "Test"}']
+        assert result.warning_count == 1
+
+    def test_validate_all_parses_each_file_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test checks sharing a file reuse one duplicate-checked parse."""
+        filament_dir = tmp_path / "BBL" / "filament"
+        filament_dir.mkdir(parents=True)
+        profile = filament_dir / "test_profile.json"
+        profile.write_text('{"name": "Test", "filament_id": "GFL99"}')
+
+        parsed: list[Path] = []
+        original = validator_module.load_json_with_duplicate_check
+
+        def counting_load(file_path: Path) -> dict:
+            parsed.append(file_path)
+            return original(file_path)
+
+        monkeypatch.setattr(
+            validator_module, "load_json_with_duplicate_check", counting_load
+        )
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        validator.validate_all("BBL", check_obsolete=True)
+
+        assert parsed == [profile]
+
+    def test_validate_all_walks_each_directory_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the filament checks share one walk of the filament tree."""
+        filament_dir = tmp_path / "BBL" / "filament"
+        filament_dir.mkdir(parents=True)
+        (filament_dir / "test_profile.json").write_text('{"name": "Test"}')
+
+        walked: list[Path] = []
+        original = validator_module._find_json_files
+
+        def counting_find(root: Path) -> list[Path]:
+            walked.append(root)
+            return original(root)
+
+        monkeypatch.setattr(validator_module, "_find_json_files", counting_find)
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        validator.validate_all("BBL", check_materials=False, check_obsolete=True)
+
+        assert walked.count(filament_dir) == 1
+
+    def test_cached_file_reloaded_after_change(self, tmp_path: Path) -> None:
+        """Test a cached parse is dropped when the file's mtime changes."""
+        filament_dir = tmp_path / "TestVendor" / "filament"
+        filament_dir.mkdir(parents=True)
+        profile = filament_dir / "test_profile.json"
+        profile.write_text('{"name": "Test"}')
+
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        assert validator.validate_obsolete_keys("TestVendor").warning_count == 0
+
+        profile.write_text('{"name": "Test", "acceleration": 1000}')
+        stat = profile.stat()
+        os.utime(profile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert validator.validate_obsolete_keys("TestVendor").warning_count == 1
+
     def test_validate_filament_compatible_printers_missing(self, tmp_path: Path) -> None:
         """Test validation fails when compatible_printers missing."""
         # Setup directory structure
@@ -170,6 +384,20 @@ class TestProfileValidator:
         assert result.has_errors
         assert any("compatible_printers" in i.message for i in result.errors)
 
+    def test_validate_filament_compatible_printers_empty_file(
+        self, tmp_path: Path
+    ) -> None:
+        """Test an empty profile file is reported, not silently skipped."""
+        filament_dir = tmp_path / "TestVendor" / "filament"
+        filament_dir.mkdir(parents=True)
+        (filament_dir / "empty.json").write_text("")
+
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        result = validator.validate_filament_compatible_printers("TestVendor")
+
+        assert [i.file_path for i in result.errors] == [filament_dir / "empty.json"]
+        assert result.errors[0].message.startswith("Error loading empty.json")
+
     def test_validate_filament_compatible_printers_valid(self, tmp_path: Path) -> None:
         """Test validation passes with compatible_printers."""
         vendor_dir = tmp_path / "samples" / "profiles" / "TestVendor"
@@ -207,6 +435,96 @@ class TestProfileValidator:
         assert result.has_errors
         assert any("NonExistent" in i.message for i in result.errors)
 
+    def test_validate_machine_default_materials_string(self, tmp_path: Path) -> None:
+        """Test semicolon-separated default materials are split and trimmed."""
+        vendor_dir = tmp_path / "TestVendor"
+        machine_dir = vendor_dir / "machine"
+        filament_dir = vendor_dir / "filament"
+        machine_dir.mkdir(parents=True)
+        filament_dir.mkdir(parents=True)
+        (filament_dir / "pla.json").write_text('{"name": "Generic PLA"}')
+
+        (machine_dir / "test_machine.json").write_text(
+            '{"name": "TestMachine",'
+            ' "default_filament_profile": " Generic PLA ;; Missing One ; "}'
+        )
+
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        result = validator.validate_machine_default_materials("TestVendor")
+
+        assert [i.message for i in result.errors] == ["Missing filament: Missing One"]
+
+    def test_filament_names_loaded_once_per_vendor(self, tmp_path: Path) -> None:
+        """Test the shared filament library is read once across vendors."""
+        library_dir = tmp_path / "OrcaFilamentLibrary" / "filament"
+        library_dir.mkdir(parents=True)
+        (library_dir / "pla.json").write_text('{"name": "Generic PLA"}')
+        for vendor in ("VendorA", "VendorB"):
+            machine_dir = tmp_path / vendor / "machine"
+            machine_dir.mkdir(parents=True)
+            (machine_dir / "machine.json").write_text(
+                '{"name": "Machine", "default_materials": ["Generic PLA"]}'
+            )
+
+        decoded: list[bytes] = []
+
+        def loads(data: bytes) -> dict:
+            decoded.append(data)
+            return json.loads(data)
+
+        validator = ProfileValidator(profiles_dir=tmp_path, loads=loads)
+        for vendor in ("VendorA", "VendorB"):
+            result = validator.validate_machine_default_materials(vendor)
+            assert not result.has_errors
+
+        assert decoded.count(b'{"name": "Generic PLA"}') == 1
+
+    def test_validate_all_drops_parsed_files(self, tmp_path: Path) -> None:
+        """Test validate_all frees parsed files but keeps filament names."""
+        library_dir = tmp_path / "OrcaFilamentLibrary" / "filament"
+        library_dir.mkdir(parents=True)
+        (library_dir / "pla.json").write_text('{"name": "Generic PLA"}')
+        machine_dir = tmp_path / "VendorA" / "machine"
+        machine_dir.mkdir(parents=True)
+        (machine_dir / "machine.json").write_text(
+            '{"name": "Machine", "default_materials": ["Generic PLA"]}'
+        )
+
+        validator = ProfileValidator(profiles_dir=tmp_path)
+        result = validator.validate_all("VendorA")
+
+        assert not result.has_errors
+        assert not validator._cache
+        assert not validator._file_lists
+        assert "OrcaFilamentLibrary" in validator._filament_names
+
+    def test_validate_all_from_threads(self, tmp_path: Path) -> None:
+        """Test one validator can check several vendors concurrently."""
+        library_dir = tmp_path / "OrcaFilamentLibrary" / "filament"
+        library_dir.mkdir(parents=True)
+        (library_dir / "pla.json").write_text('{"name": "Generic PLA"}')
+        vendors = [f"Vendor{i}" for i in range(8)]
+        for vendor in vendors:
+            machine_dir = tmp_path / vendor / "machine"
+            machine_dir.mkdir(parents=True)
+            (machine_dir / "machine.json").write_text(
+                '{"name": "Machine", "default_materials": ["Generic PLA", "Gone"]}'
+            )
+
+        decoded: list[bytes] = []
+
+        def loads(data: bytes) -> dict:
+            decoded.append(data)
+            return json.loads(data)
+
+        validator = ProfileValidator(profiles_dir=tmp_path, loads=loads)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(validator.validate_all, vendors))
+
+        for result in results:
+            assert [i.message for i in result.errors] == ["Missing filament: Gone"]
+        assert decoded.count(b'{"name": "Generic PLA"}') == 1
+
     def test_validate_filament_id_valid(self, tmp_path: Path) -> None:
         """Test validation passes with valid filament ID."""
         vendor_dir = tmp_path / "samples" / "profiles" / "BBL"
@@ -268,6 +586,21 @@ class TestProfileValidator:
 
         assert result.warning_count > 0 or result.error_count > 0
 
+    def test_validate_obsolete_keys_bom_skipped(self, tmp_path: Path) -> None:
+        """Test a BOM-prefixed profile is rejected like text-mode json.load."""
+        vendor_dir = tmp_path / "samples" / "profiles" / "TestVendor"
+        filament_dir = vendor_dir / "filament"
+        filament_dir.mkdir(parents=True)
+
+        profile = filament_dir / "test_profile.json"
+        profile.write_bytes(b'\xef\xbb\xbf{"name": "Test", "acceleration": 1000}')
+
+        validator = ProfileValidator(profiles_dir=tmp_path / "samples" / "profiles")
+        result = validator.validate_obsolete_keys("TestVendor")
+
+        assert result.files_checked == 0
+        assert not result.issues
+
     def test_validate_conflict_keys_none(self, tmp_path: Path) -> None:
         """Test validation passes with no conflicting keys."""
         vendor_dir = tmp_path / "samples" / "profiles" / "TestVendor"